@@ -9,82 +9,333 @@ Creates 3D visualizations of:
 - Time dilation τ effects
 """
 
+from functools import lru_cache
+from importlib.util import find_spec
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import matplotlib.colors as colors
 from matplotlib.colors import LogNorm
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+# numba is optional and costs about a second to import, so it is only
+# imported when the numba backend is first used; NumPy kernels otherwise
+HAVE_NUMBA = find_spec('numba') is not None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; NumPy kernels are used instead
+    ne = None
+
+try:
+    import cupy as cp
+    if not cp.cuda.is_available():
+        cp = None
+except ImportError:  # cupy is optional; fields are evaluated on the CPU instead
+    cp = None
+
+try:
+    from skimage.measure import marching_cubes
+except ImportError:  # scikit-image is optional; isosurfaces fall back to point clouds
+    marching_cubes = None
 
 # Physical constants
 G = 6.67430e-11
 c = 299792458
 M_sun = 1.989e30
 
+_fields_kernel = None
+
+def _get_fields_kernel():
+    """Import numba and compile (or load from its disk cache) the fused kernel once."""
+    global _fields_kernel
+    if _fields_kernel is None:
+        from numba import njit, prange
+        
+        @njit(parallel=True, fastmath=True, cache=True)
+        def kernel(X, Y, Z, r_s, GM_over_c2, out_mu, out_rho, out_chi, out_tau):
+            """Fused μ, ρ, χ, τ kernel over a 3D grid, parallel over the first axis."""
+            r_min = r_s * 1e-6
+            half_inv_rs = 0.5 / r_s
+            two_rs = 2.0 * r_s
+            for i in prange(X.shape[0]):
+                for j in range(X.shape[1]):
+                    for k in range(X.shape[2]):
+                        x, y, z = X[i, j, k], Y[i, j, k], Z[i, j, k]
+                        r = max(np.sqrt(x * x + y * y + z * z), r_min)
+                        inv_r = 1.0 / r
+                        chi = r_s * inv_r
+                        out_mu[i, j, k] = r * half_inv_rs
+                        out_rho[i, j, k] = GM_over_c2 * inv_r * inv_r * inv_r
+                        out_chi[i, j, k] = chi * chi
+                        out_tau[i, j, k] = two_rs * inv_r
+        
+        _fields_kernel = kernel
+    return _fields_kernel
+
+@lru_cache(maxsize=8)
+def _grid2d(max_radius, grid_size, dtype):
+    """
+    X, Y meshgrid spanning ±max_radius for a cross-section.
+    
+    Cached per (extent, size, dtype) and returned read-only, since
+    every z slice of the same grid shares the arrays.
+    """
+    x = np.linspace(-max_radius, max_radius, grid_size, dtype=dtype)
+    y = np.linspace(-max_radius, max_radius, grid_size, dtype=dtype)
+    X, Y = np.meshgrid(x, y)
+    X.flags.writeable = False
+    Y.flags.writeable = False
+    return X, Y
+
 class BlackHole3DSimulation:
     """3D simulation of black hole using universal change equation."""
     
-    def __init__(self, mass=10*M_sun):
+    # Working-set target for one slab of the blocked NumPy kernel (~L2)
+    _TILE_BYTES = 256 * 1024
+    # Grid cells above which slabbing beats one whole-grid NumPy pass; below
+    # it the per-slab overhead costs more than the cache misses it saves
+    _BLOCKED_MIN_CELLS = 192 ** 3
+    # Grid cells above which the GPU beats its host/device transfers
+    _GPU_MIN_CELLS = 128 ** 3
+    # Grid cells above which the numba kernel beats the blocked NumPy kernel
+    # by enough to pay for importing numba
+    _NUMBA_MIN_CELLS = 256 ** 3
+    
+    def __init__(self, mass=10*M_sun, backend=None):
+        """
+        Args:
+            mass: Black hole mass (kg)
+            backend: Field kernel backend: 'numpy', 'numexpr', 'numba' or 'cupy'.
+                None picks the fastest installed one for each grid.
+        """
+        available = self.available_backends()
+        if backend is not None and backend not in available:
+            raise ValueError(f"Backend {backend!r} unavailable; choose from {available}")
+        self._backend = backend
+        
         self.mass = mass
         self.r_s = 2 * G * mass / (c**2)  # Schwarzschild radius
+        
+        # Scalar constants shared by every field evaluation
+        self._two_rs = 2 * self.r_s
+        self._inv_two_rs = 1.0 / self._two_rs
+        self._rs2 = self.r_s**2
+        self._GM_c2 = G * mass / c**2
+        self._r_min = self.r_s * 1e-6  # Radius floor to avoid the singularity
+        
+        # Event horizon outline (unit circle in r_s units), shared by all plots
+        theta = np.linspace(0, 2 * np.pi, 128)
+        self._horizon_xy = np.stack([np.cos(theta), np.sin(theta)])
         print(f"🕳️ 3D Black Hole Simulation")
         print(f"Mass: {mass/M_sun:.1f} Solar Masses")
         print(f"Schwarzschild Radius: {self.r_s:.2e} meters")
         print(f"Using: μ = ρ/χ = r/(2r_s) = 1/τ")
         print()
     
+    @staticmethod
+    def available_backends():
+        """List the field kernel backends usable in this environment."""
+        backends = ['numpy']
+        if ne is not None:
+            backends.append('numexpr')
+        if HAVE_NUMBA:
+            backends.append('numba')
+        if cp is not None:
+            backends.append('cupy')
+        return backends
+    
     def calculate_radius_3d(self, x, y, z):
         """Calculate radius from center in 3D."""
-        return np.sqrt(x**2 + y**2 + z**2)
+        return np.sqrt(x * x + y * y + z * z)
+    
+    def _fields(self, x, y, z):
+        """
+        Calculate μ, ρ, χ and τ together from a single radius pass.
+        
+        Dispatches to the configured backend. Without one, large 3D grids
+        run on the GPU with cupy or, failing that, the fused numba kernel;
+        everything else uses numexpr, falling back to NumPy when those are
+        not installed.
+        """
+        shape = np.broadcast_shapes(np.shape(x), np.shape(y), np.shape(z))
+        backend = self._backend
+        if backend is None:
+            if cp is not None and len(shape) == 3 and np.prod(shape) >= self._GPU_MIN_CELLS:
+                backend = 'cupy'
+            elif HAVE_NUMBA and len(shape) == 3 and np.prod(shape) >= self._NUMBA_MIN_CELLS:
+                backend = 'numba'
+            elif ne is not None:
+                backend = 'numexpr'
+            else:
+                backend = 'numpy'
+        
+        # The numba kernel is 3D only; 2D slices use the NumPy path
+        if backend == 'numba' and len(shape) == 3:
+            return self._fields_numba(x, y, z, shape)
+        if backend == 'cupy':
+            return self._fields_cupy(x, y, z, shape)
+        if backend == 'numexpr':
+            return self._fields_numexpr(x, y, z)
+        if len(shape) == 3 and np.prod(shape) >= self._BLOCKED_MIN_CELLS:
+            return self._fields_blocked(x, y, z, shape)
+        return self._fields_numpy(x, y, z)
+    
+    def _fields_numpy(self, x, y, z, out=None):
+        """
+        NumPy field kernel.
+        
+        r and 1/r are computed once and shared; every field is then
+        derived with in-place ufuncs so no extra temporaries are allocated.
+        
+        Args:
+            x, y, z: Coordinates (meters), broadcastable to a common shape
+            out: Optional (mu, rho, chi, tau) arrays to write into
+        """
+        if out is None:
+            shape = np.broadcast_shapes(np.shape(x), np.shape(y), np.shape(z))
+            dtype = np.result_type(x, y, z, 1.0)
+            out = tuple(np.empty(shape, dtype=dtype) for _ in range(4))
+        mu, rho, chi, tau = out
+        
+        # r, built in the μ buffer; the τ buffer holds each squared term
+        np.multiply(x, x, out=mu)
+        np.multiply(y, y, out=tau)
+        mu += tau
+        np.multiply(z, z, out=tau)
+        mu += tau
+        np.sqrt(mu, out=mu)
+        # Avoid division by zero at center
+        np.maximum(mu, self._r_min, out=mu)
+        # 1/r, held in the ρ buffer until ρ is formed
+        np.reciprocal(mu, out=rho)
+        
+        # τ = 2r_s/r
+        np.multiply(rho, self._two_rs, out=tau)
+        # χ = (r_s/r)²
+        np.multiply(rho, self.r_s, out=chi)
+        np.square(chi, out=chi)
+        # ρ = GM/(r³c²) = χ/(2r_s r)
+        rho *= chi
+        rho *= self._inv_two_rs
+        # μ = r/(2r_s)
+        mu *= self._inv_two_rs
+        
+        return mu, rho, chi, tau
+    
+    def _fields_blocked(self, x, y, z, shape):
+        """
+        Run the NumPy kernel over a 3D grid in cache-sized slabs.
+        
+        Each slab of rows along the first axis is small enough for the
+        kernel's passes over it to hit cache instead of DRAM.
+        """
+        dtype = np.result_type(x, y, z, 1.0)
+        out = tuple(np.empty(shape, dtype=dtype) for _ in range(4))
+        rows = max(1, self._TILE_BYTES // (4 * shape[1] * shape[2] * dtype.itemsize))
+        
+        for start in range(0, shape[0], rows):
+            tile = slice(start, start + rows)
+            # Inputs broadcast along the first axis are shared by every slab
+            x_t, y_t, z_t = (a[tile] if np.ndim(a) == 3 and np.shape(a)[0] > 1 else a
+                             for a in (x, y, z))
+            self._fields_numpy(x_t, y_t, z_t, out=tuple(field[tile] for field in out))
+        
+        return out
+    
+    def _fields_numexpr(self, x, y, z):
+        """Evaluate all four fields with numexpr's blocked, multithreaded VM."""
+        r = ne.evaluate("sqrt(x*x + y*y + z*z)")
+        # Constants in the grid dtype so numexpr does not upcast float32
+        k = {name: r.dtype.type(value) for name, value in (
+            ('r_min', self._r_min), ('rs', self.r_s), ('two_rs', self._two_rs),
+            ('inv_two_rs', self._inv_two_rs), ('one', 1.0))}
+        ne.evaluate("where(r < r_min, r_min, r)", local_dict={'r': r, **k}, out=r)
+        
+        # 1/r once, shared by τ, χ and ρ as in the NumPy kernel; ρ = χ/(2r_s r)
+        # never forms r³, which overflows float32 for large holes
+        env = {'r': r, **k}
+        mu = ne.evaluate("r * inv_two_rs", local_dict=env)
+        env['inv_r'] = ne.evaluate("one / r", local_dict=env)
+        tau = ne.evaluate("inv_r * two_rs", local_dict=env)
+        chi = ne.evaluate("(inv_r * rs)**2", local_dict=env)
+        env['chi'] = chi
+        rho = ne.evaluate("inv_r * chi * inv_two_rs", local_dict=env)
+        return mu, rho, chi, tau
+    
+    def _fields_numba(self, x, y, z, shape):
+        """Evaluate all four fields on a 3D grid with the numba kernel."""
+        # Zero-stride views: the grid axes are never materialized to N³
+        X, Y, Z = (np.broadcast_to(a, shape) for a in (x, y, z))
+        dtype = np.result_type(X, Y, Z, 1.0)
+        mu, rho, chi, tau = (np.empty(shape, dtype=dtype) for _ in range(4))
+        # Scalars in the grid dtype so the kernel specializes on it
+        _get_fields_kernel()(X, Y, Z, dtype.type(self.r_s), dtype.type(self._GM_c2),
+                             mu, rho, chi, tau)
+        return mu, rho, chi, tau
+    
+    def _fields_cupy(self, x, y, z, shape):
+        """
+        Evaluate all four fields on the GPU with cupy.
+        
+        Only the coordinate inputs go to the device (grid axes stay 1D
+        views) and the four fields come back as NumPy arrays, so callers
+        and plotting code never see device arrays.
+        """
+        xd, yd, zd = (cp.asarray(a) for a in (x, y, z))
+        dtype = np.result_type(np.asarray(x).dtype, np.asarray(y).dtype, np.asarray(z).dtype, 1.0)
+        out = tuple(cp.empty(shape, dtype=dtype) for _ in range(4))
+        # The NumPy kernel's ufuncs dispatch to cupy for device arrays
+        self._fields_numpy(xd, yd, zd, out=out)
+        return tuple(field.get() for field in out)
     
     def calculate_mu_3d(self, x, y, z):
         """Calculate μ = r/(2r_s) in 3D space."""
-        r = self.calculate_radius_3d(x, y, z)
-        # Avoid division by zero at center
-        r = np.maximum(r, self.r_s * 1e-6)
-        mu = r / (2 * self.r_s)
-        return mu
+        return self._fields(x, y, z)[0]
     
     def calculate_rho_3d(self, x, y, z):
         """Calculate energy density ρ = GM/(r³c²) in 3D."""
-        r = self.calculate_radius_3d(x, y, z)
-        r = np.maximum(r, self.r_s * 1e-6)  # Avoid singularity
-        rho = G * self.mass / (r**3 * c**2)
-        return rho
+        return self._fields(x, y, z)[1]
     
     def calculate_chi_3d(self, x, y, z):
         """Calculate resistance χ = (r_s/r)² in 3D."""
-        r = self.calculate_radius_3d(x, y, z)
-        r = np.maximum(r, self.r_s * 1e-6)
-        chi = (self.r_s / r)**2
-        return chi
+        return self._fields(x, y, z)[2]
     
     def calculate_tau_3d(self, x, y, z):
         """Calculate time dilation τ = 2r_s/r in 3D."""
-        r = self.calculate_radius_3d(x, y, z)
-        r = np.maximum(r, self.r_s * 1e-6)
-        tau = 2 * self.r_s / r
-        return tau
+        return self._fields(x, y, z)[3]
     
-    def create_3d_grid(self, grid_size=50, max_radius_factor=2.0):
-        """Create 3D coordinate grid."""
+    def create_3d_grid(self, grid_size=50, max_radius_factor=2.0, dtype=np.float32):
+        """
+        Create 3D coordinate grid.
+        
+        X, Y and Z are returned as (N,1,1), (1,N,1) and (1,1,N) views of
+        the same coordinate axis; field arithmetic broadcasts them to the
+        full N³ grid without materializing three N³ coordinate arrays.
+        The grid is single precision by default since it only feeds plots.
+        """
         max_radius = self.r_s * max_radius_factor
-        coords = np.linspace(-max_radius, max_radius, grid_size)
-        X, Y, Z = np.meshgrid(coords, coords, coords)
+        coords = np.linspace(-max_radius, max_radius, grid_size, dtype=dtype)
+        X = coords.reshape(-1, 1, 1)
+        Y = coords.reshape(1, -1, 1)
+        Z = coords.reshape(1, 1, -1)
         return X, Y, Z, coords
     
-    def simulate_cross_section(self, z_slice=0, grid_size=100):
-        """Create 2D cross-section through black hole center."""
-        max_radius = self.r_s * 3
-        x = np.linspace(-max_radius, max_radius, grid_size)
-        y = np.linspace(-max_radius, max_radius, grid_size)
-        X, Y = np.meshgrid(x, y)
+    def simulate_cross_section(self, z_slice=0, grid_size=100, dtype=np.float32):
+        """
+        Create 2D cross-section through black hole center.
+        
+        The returned X and Y come from a cache shared by every slice of the
+        same grid, so they are read-only; copy them before modifying.
+        """
+        X, Y = _grid2d(self.r_s * 3, grid_size, np.dtype(dtype))
         Z = np.full_like(X, z_slice)
         
-        # Calculate fields
-        mu_field = self.calculate_mu_3d(X, Y, Z)
-        rho_field = self.calculate_rho_3d(X, Y, Z)
-        chi_field = self.calculate_chi_3d(X, Y, Z)
-        tau_field = self.calculate_tau_3d(X, Y, Z)
+        # Calculate all fields from one shared radius pass
+        mu_field, rho_field, chi_field, tau_field = self._fields(X, Y, Z)
         
         return X, Y, mu_field, rho_field, chi_field, tau_field
     
@@ -95,41 +346,43 @@ class BlackHole3DSimulation:
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
         
         # Convert to units of Schwarzschild radius for plotting
+        # (pcolormesh shades the grid directly; no contour triangulation,
+        # and LogNorm maps the log panels at draw time without a log10 pass)
         X_rs = X / self.r_s
         Y_rs = Y / self.r_s
         
         # Plot 1: Change Flow Rate μ
-        im1 = ax1.contourf(X_rs, Y_rs, mu_field, levels=50, cmap='viridis')
+        im1 = ax1.pcolormesh(X_rs, Y_rs, mu_field, cmap='viridis', shading='gouraud')
         ax1.set_title('Change Flow Rate μ = r/(2r_s)')
         ax1.set_xlabel('x/r_s')
         ax1.set_ylabel('y/r_s')
-        ax1.add_patch(plt.Circle((0, 0), 1, fill=False, color='red', linewidth=2, label='Event Horizon'))
+        ax1.plot(*self._horizon_xy, 'r-', linewidth=2, label='Event Horizon')
         plt.colorbar(im1, ax=ax1, label='μ')
         ax1.legend()
         
         # Plot 2: Energy Density ρ (log scale)
-        im2 = ax2.contourf(X_rs, Y_rs, np.log10(rho_field), levels=50, cmap='plasma')
+        im2 = ax2.pcolormesh(X_rs, Y_rs, rho_field, cmap='plasma', shading='gouraud', norm=LogNorm())
         ax2.set_title('Energy Density ρ = GM/(r³c²)')
         ax2.set_xlabel('x/r_s')
         ax2.set_ylabel('y/r_s')
-        ax2.add_patch(plt.Circle((0, 0), 1, fill=False, color='red', linewidth=2))
-        plt.colorbar(im2, ax=ax2, label='log₁₀(ρ)')
+        ax2.plot(*self._horizon_xy, 'r-', linewidth=2)
+        plt.colorbar(im2, ax=ax2, label='ρ')
         
         # Plot 3: Resistance to Change χ (log scale)
-        im3 = ax3.contourf(X_rs, Y_rs, np.log10(chi_field), levels=50, cmap='inferno')
+        im3 = ax3.pcolormesh(X_rs, Y_rs, chi_field, cmap='inferno', shading='gouraud', norm=LogNorm())
         ax3.set_title('Resistance to Change χ = (r_s/r)²')
         ax3.set_xlabel('x/r_s')
         ax3.set_ylabel('y/r_s')
-        ax3.add_patch(plt.Circle((0, 0), 1, fill=False, color='red', linewidth=2))
-        plt.colorbar(im3, ax=ax3, label='log₁₀(χ)')
+        ax3.plot(*self._horizon_xy, 'r-', linewidth=2)
+        plt.colorbar(im3, ax=ax3, label='χ')
         
         # Plot 4: Time Dilation τ (log scale)
-        im4 = ax4.contourf(X_rs, Y_rs, np.log10(tau_field), levels=50, cmap='coolwarm')
+        im4 = ax4.pcolormesh(X_rs, Y_rs, tau_field, cmap='coolwarm', shading='gouraud', norm=LogNorm())
         ax4.set_title('Time Dilation τ = 2r_s/r')
         ax4.set_xlabel('x/r_s')
         ax4.set_ylabel('y/r_s')
-        ax4.add_patch(plt.Circle((0, 0), 1, fill=False, color='red', linewidth=2))
-        plt.colorbar(im4, ax=ax4, label='log₁₀(τ)')
+        ax4.plot(*self._horizon_xy, 'r-', linewidth=2)
+        plt.colorbar(im4, ax=ax4, label='τ')
         
         plt.tight_layout()
         plt.suptitle('Black Hole Cross-Section: Universal Change Fields', fontsize=16, y=0.98)
@@ -137,25 +390,140 @@ class BlackHole3DSimulation:
         
         return fig
     
+    def _mu_band_points(self, mu_field, coords, bands):
+        """
+        Collect grid points lying in each μ band in a single field pass.
+        
+        Args:
+            mu_field: μ values on the grid spanned by coords (N³)
+            coords: 1D coordinate axis shared by x, y and z (meters)
+            bands: Sequence of (mu_level, tolerance) pairs
+            
+        Returns:
+            List with one (n, 3) array of points per band, in r_s units
+        """
+        lows = [mu_level - tol for mu_level, tol in bands]
+        highs = [mu_level + tol for mu_level, tol in bands]
+        edges = np.unique(lows + highs)
+        
+        # Bin index of every grid point against all band edges at once
+        bins = np.digitize(mu_field, edges)
+        band_bins = [(np.searchsorted(edges, lo) + 1, np.searchsorted(edges, hi))
+                     for lo, hi in zip(lows, highs)]
+        
+        # Gather only the cells that fall inside some band
+        in_band = np.zeros(edges.size + 1, dtype=bool)
+        for first, last in band_bins:
+            in_band[first:last + 1] = True
+        i, j, k = np.nonzero(in_band[bins])
+        hit_bins = bins[i, j, k]
+        points = np.column_stack((coords[i], coords[j], coords[k])) / self.r_s
+        
+        return [points[(hit_bins >= first) & (hit_bins <= last)]
+                for first, last in band_bins]
+    
+    def _mu_isosurface(self, mu_field, coords, mu_level):
+        """
+        Extract the μ = mu_level surface as a triangle mesh.
+        
+        Returns:
+            (m, 3, 3) array of triangle vertices in r_s units, or None
+            when the level is not crossed anywhere on the grid
+        """
+        if not mu_field.min() < mu_level < mu_field.max():
+            return None
+        spacing = (coords[1] - coords[0],) * 3
+        verts, faces, _, _ = marching_cubes(mu_field, level=mu_level, spacing=spacing)
+        verts += coords[0]
+        return verts[faces] / self.r_s
+    
+    def _draw_mu_level(self, ax, shape, color, alpha, size, label):
+        """
+        Draw a μ level given as a triangle mesh (m, 3, 3) or points (n, 3).
+        
+        alpha and size style point clouds; meshes are always drawn
+        translucent so nested shells stay visible.
+        """
+        if shape is None or not len(shape):
+            return
+        if shape.ndim == 3:
+            ax.add_collection3d(Poly3DCollection(shape, facecolor=color, edgecolor='none',
+                                                 alpha=0.3, label=label))
+        else:
+            ax.scatter(*shape.T, c=color, s=size, alpha=alpha, label=label)
+    
+    def _draw_mu_levels(self, ax, shapes, level_colors, alpha, size, labels):
+        """
+        Draw several μ levels as one collection per kind, colored per level.
+        
+        Meshes become a single Poly3DCollection and point clouds a single
+        scatter (a level may be either); legend entries come from proxy
+        handles, one per level.
+        """
+        drawn = [(shape, color, label) for shape, color, label in zip(shapes, level_colors, labels)
+                 if shape is not None and len(shape)]
+        if not drawn:
+            return
+        for ndim in (3, 2):
+            group = [(shape, color) for shape, color, _ in drawn if shape.ndim == ndim]
+            if not group:
+                continue
+            merged = np.concatenate([shape for shape, _ in group])
+            per_item = np.repeat([color for _, color in group], [len(shape) for shape, _ in group])
+            if ndim == 3:
+                ax.add_collection3d(Poly3DCollection(merged, facecolor=per_item, edgecolor='none', alpha=0.3))
+            else:
+                ax.scatter(*merged.T, c=per_item, s=size, alpha=alpha)
+        handles = [Patch(facecolor=color, alpha=0.3, label=label) if shape.ndim == 3 else
+                   Line2D([], [], linestyle='none', marker='o', color=color, alpha=alpha, label=label)
+                   for shape, color, label in drawn]
+        ax.legend(handles=handles)
+    
     def plot_3d_isosurfaces(self):
         """Plot 3D isosurfaces of μ field."""
         # Create smaller grid for 3D visualization
         X, Y, Z, coords = self.create_3d_grid(grid_size=30, max_radius_factor=2.0)
         
-        # Calculate μ field
+        # Calculate μ field (broadcasts the grid views to N³)
         mu_field = self.calculate_mu_3d(X, Y, Z)
         
-        fig = plt.figure(figsize=(15, 5))
+        # Event horizon plus the nested change flow surfaces
+        mu_levels = [0.5, 0.2, 0.1, 0.05]
+        colors = ['red', 'orange', 'yellow', 'white']
+        if marching_cubes is not None:
+            # Interpolated isosurfaces: a few thousand triangles per level
+            level_shapes = [self._mu_isosurface(mu_field, coords, mu_level)
+                            for mu_level in mu_levels]
+            # Levels the grid never crosses (μ = 0.05 sits just below the
+            # smallest μ on 30³) fall back to the cells lying near them
+            unresolved = [i for i, shape in enumerate(level_shapes) if shape is None]
+            if unresolved:
+                band_points = self._mu_band_points(mu_field, coords,
+                                                   [(mu_levels[i], 0.02) for i in unresolved])
+                for i, points in zip(unresolved, band_points):
+                    level_shapes[i] = points
+            horizon_shape = level_shapes[0]
+        else:
+            # Point clouds of grid cells lying near each level
+            bands = [(0.5, 0.05)] + [(mu_level, 0.02) for mu_level in mu_levels]
+            horizon_shape, *level_shapes = self._mu_band_points(mu_field, coords, bands)
+        interior_shape = level_shapes[mu_levels.index(0.1)]
         
-        # Plot 1: μ = 0.5 surface (event horizon)
+        fig = plt.figure(figsize=(15, 5))
         ax1 = fig.add_subplot(131, projection='3d')
+        ax2 = fig.add_subplot(132, projection='3d')
+        ax3 = fig.add_subplot(133, projection='3d')
         
-        # Find points where μ ≈ 0.5 (event horizon)
-        mask_horizon = np.abs(mu_field - 0.5) < 0.05
-        if np.any(mask_horizon):
-            x_h, y_h, z_h = X[mask_horizon], Y[mask_horizon], Z[mask_horizon]
-            ax1.scatter(x_h/self.r_s, y_h/self.r_s, z_h/self.r_s, 
-                       c='red', s=1, alpha=0.6, label='μ = 0.5 (Event Horizon)')
+        # Pin all panels to the grid extent up front; explicit limits
+        # keep meshes added below from autoscaling the axes
+        extent = (coords[0] / self.r_s, coords[-1] / self.r_s)
+        for ax in (ax1, ax2, ax3):
+            ax.set_xlim(extent)
+            ax.set_ylim(extent)
+            ax.set_zlim(extent)
+        
+        # Plot 1: μ = 0.5 surface (event horizon)
+        self._draw_mu_level(ax1, horizon_shape, 'red', 0.6, 1, 'μ = 0.5 (Event Horizon)')
         
         ax1.set_title('Event Horizon\nμ = 0.5')
         ax1.set_xlabel('x/r_s')
@@ -164,13 +532,7 @@ class BlackHole3DSimulation:
         ax1.legend()
         
         # Plot 2: μ = 0.1 surface (deep interior)
-        ax2 = fig.add_subplot(132, projection='3d')
-        
-        mask_interior = np.abs(mu_field - 0.1) < 0.02
-        if np.any(mask_interior):
-            x_i, y_i, z_i = X[mask_interior], Y[mask_interior], Z[mask_interior]
-            ax2.scatter(x_i/self.r_s, y_i/self.r_s, z_i/self.r_s, 
-                       c='orange', s=1, alpha=0.8, label='μ = 0.1')
+        self._draw_mu_level(ax2, interior_shape, 'orange', 0.8, 1, 'μ = 0.1')
         
         ax2.set_title('Deep Interior\nμ = 0.1')
         ax2.set_xlabel('x/r_s')
@@ -179,23 +541,13 @@ class BlackHole3DSimulation:
         ax2.legend()
         
         # Plot 3: Multiple μ surfaces
-        ax3 = fig.add_subplot(133, projection='3d')
-        
-        mu_levels = [0.5, 0.2, 0.1, 0.05]
-        colors = ['red', 'orange', 'yellow', 'white']
-        
-        for mu_level, color in zip(mu_levels, colors):
-            mask = np.abs(mu_field - mu_level) < 0.02
-            if np.any(mask):
-                x_m, y_m, z_m = X[mask], Y[mask], Z[mask]
-                ax3.scatter(x_m/self.r_s, y_m/self.r_s, z_m/self.r_s, 
-                           c=color, s=0.5, alpha=0.6, label=f'μ = {mu_level}')
+        self._draw_mu_levels(ax3, level_shapes, colors, 0.6, 0.5,
+                             [f'μ = {mu_level}' for mu_level in mu_levels])
         
         ax3.set_title('Change Flow Surfaces')
         ax3.set_xlabel('x/r_s')
         ax3.set_ylabel('y/r_s')
         ax3.set_zlabel('z/r_s')
-        ax3.legend()
         
         plt.tight_layout()
         plt.show()
@@ -208,10 +560,10 @@ class BlackHole3DSimulation:
         r_array = np.logspace(np.log10(self.r_s * 0.01), np.log10(self.r_s * 5), 1000)
         
         # Calculate fields along radial direction
-        mu_radial = r_array / (2 * self.r_s)
-        rho_radial = G * self.mass / (r_array**3 * c**2)
-        chi_radial = (self.r_s / r_array)**2
-        tau_radial = 2 * self.r_s / r_array
+        mu_radial = r_array * self._inv_two_rs
+        rho_radial = self._GM_c2 / (r_array * r_array * r_array)
+        chi_radial = self._rs2 / (r_array * r_array)
+        tau_radial = self._two_rs / r_array
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
@@ -275,10 +627,11 @@ class BlackHole3DSimulation:
         print(f"{'Location':<20} {'r/r_s':<10} {'μ':<12} {'τ':<12} {'Physical State'}")
         print("-" * 70)
         
-        for name, radius in key_radii.items():
-            mu = radius / (2 * self.r_s)
-            tau = 2 * self.r_s / radius
-            
+        radii = np.array(list(key_radii.values()))
+        mu_values = radii * self._inv_two_rs
+        tau_values = self._two_rs / radii
+        
+        for name, radius, mu, tau in zip(key_radii, radii, mu_values, tau_values):
             if mu > 0.4:
                 state = "Normal spacetime"
             elif mu > 0.1:
@@ -23,11 +23,19 @@ class BlackHoleSimulation:
     
     def __init__(self):
         self.tolerance = 1e-15
+        self._r_s_cache = {}  # mass -> Schwarzschild radius
         
     def calculate_schwarzschild_radius(self, mass):
         """Calculate Schwarzschild radius: r_s = 2GM/c²"""
         return 2 * G * mass / (c**2)
     
+    def _rs_for(self, mass):
+        """Schwarzschild radius for mass, computed once per distinct mass."""
+        r_s = self._r_s_cache.get(mass)
+        if r_s is None:
+            r_s = self._r_s_cache[mass] = self.calculate_schwarzschild_radius(mass)
+        return r_s
+    
     def calculate_energy_density_at_radius(self, mass, r):
         """
         Calculate energy density ρ approaching black hole center.
@@ -51,7 +59,7 @@ class BlackHoleSimulation:
         if r < self.tolerance:
             return float('inf')
         
-        r_s = self.calculate_schwarzschild_radius(mass)
+        r_s = self._rs_for(mass)
         
         # Resistance increases dramatically as we approach singularity
         # χ ∝ 1/r² (curvature effect)
@@ -64,17 +72,16 @@ class BlackHoleSimulation:
         
         Critical insight: Even though ρ → ∞ and χ → ∞,
         their ratio μ = ρ/χ → 0 as r → 0
-        """
-        rho = self.calculate_energy_density_at_radius(mass, r)
-        chi = self.calculate_resistance_to_change(mass, r)
         
-        if chi == float('inf') and rho == float('inf'):
+        With ρ = GM/(r³c²) and χ = (r_s/r)², the ratio is evaluated in
+        closed form: ρ/χ = GM/(r c² r_s²) = 1/(2 r_s r).
+        """
+        if r < self.tolerance:
             # At true singularity: μ → 0
             return 0.0
-        elif chi == float('inf'):
-            return 0.0
-        else:
-            return rho / chi
+        
+        r_s = self._rs_for(mass)
+        return 1.0 / (2 * r_s * r)
     
     def calculate_time_dilation_at_radius(self, mass, r):
         """Calculate time dilation τ = 1/μ at given radius."""
@@ -87,12 +94,21 @@ class BlackHoleSimulation:
     
     def simulate_approach_to_singularity(self, mass, num_points=20):
         """Simulate approach from event horizon to singularity."""
-        r_s = self.calculate_schwarzschild_radius(mass)
+        r_s = self._rs_for(mass)
         
         # Create logarithmic approach to center
         # From event horizon (r_s) down to near-singularity
         radii = np.logspace(np.log10(r_s), np.log10(r_s * 1e-10), num_points)
         
+        # Evaluate every radius at once, with the same r → 0 limits as the
+        # scalar calculate_* methods expressed as masks
+        at_center = radii < self.tolerance
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rho_values = np.where(at_center, np.inf, G * mass / (radii**3 * c**2))
+            chi_values = np.where(at_center, np.inf, (r_s / radii)**2)
+            mu_values = np.where(at_center, 0.0, 1.0 / (2 * r_s * radii))
+            tau_values = np.where(np.abs(mu_values) < self.tolerance, np.inf, 1.0 / mu_values)
+        
         results = []
         
         print(f"🕳️ BLACK HOLE SINGULARITY SIMULATION")
@@ -106,29 +122,15 @@ class BlackHoleSimulation:
         print(f"{'Distance from Center':<20} {'ρ (Energy Density)':<20} {'χ (Resistance)':<15} {'μ':<15} {'τ':<15}")
         print("-" * 80)
         
-        for i, r in enumerate(radii):
-            rho = self.calculate_energy_density_at_radius(mass, r)
-            chi = self.calculate_resistance_to_change(mass, r)
-            mu = self.calculate_mu_at_radius(mass, r)
-            tau = self.calculate_time_dilation_at_radius(mass, r)
-            
+        # Format the whole table first and write it in one call
+        rows = []
+        for r, rho, chi, mu, tau in zip(radii, rho_values, chi_values, mu_values, tau_values):
             # Format for display
-            if rho == float('inf'):
-                rho_str = "∞"
-            else:
-                rho_str = f"{rho:.2e}"
-                
-            if chi == float('inf'):
-                chi_str = "∞"
-            else:
-                chi_str = f"{chi:.2e}"
-                
-            if tau == float('inf'):
-                tau_str = "∞"
-            else:
-                tau_str = f"{tau:.2e}"
+            rho_str = "∞" if rho == float('inf') else f"{rho:.2e}"
+            chi_str = "∞" if chi == float('inf') else f"{chi:.2e}"
+            tau_str = "∞" if tau == float('inf') else f"{tau:.2e}"
             
-            print(f"{r/r_s:.2e} × r_s      {rho_str:<20} {chi_str:<15} {mu:<15.2e} {tau_str:<15}")
+            rows.append(f"{r/r_s:.2e} × r_s      {rho_str:<20} {chi_str:<15} {mu:<15.2e} {tau_str:<15}")
             
             results.append({
                 'radius': r,
@@ -139,12 +141,14 @@ class BlackHoleSimulation:
                 'tau': tau
             })
         
+        if rows:
+            sys.stdout.write("\n".join(rows) + "\n")
         print("-" * 80)
         return results
     
     def analyze_singularity_physics(self, mass):
         """Analyze the physics at the singularity using universal change theory."""
-        r_s = self.calculate_schwarzschild_radius(mass)
+        r_s = self._rs_for(mass)
         
         print(f"\n🔬 SINGULARITY ANALYSIS")
         print("=" * 40)
@@ -196,12 +200,14 @@ class BlackHoleSimulation:
         print(f"{'Type':<15} {'Mass (M☉)':<12} {'r_s (km)':<10} {'μ at r_s/1000':<15}")
         print("-" * 55)
         
-        for name, mass in black_holes.items():
-            r_s = self.calculate_schwarzschild_radius(mass)
-            test_radius = r_s / 1000  # Very close to singularity
-            mu = self.calculate_mu_at_radius(mass, test_radius)
-            
-            print(f"{name:<15} {mass/M_sun:<12.1e} {r_s/1000:<10.2f} {mu:<15.2e}")
+        # Evaluate the whole table at once with calculate_mu_at_radius's closed form
+        masses = np.array(list(black_holes.values()))
+        r_s = self.calculate_schwarzschild_radius(masses)
+        test_radius = r_s / 1000  # Very close to singularity
+        mu = 1.0 / (2 * r_s * test_radius)
+        
+        for name, m, r_s_m, mu_m in zip(black_holes, masses, r_s, mu):
+            print(f"{name:<15} {m/M_sun:<12.1e} {r_s_m/1000:<10.2f} {mu_m:<15.2e}")
 
 def main():
     """Run black hole center simulation."""
@@ -9,9 +9,12 @@ Features:
 - Change flow vector field
 """
 
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import matplotlib.animation as animation
 from matplotlib.colors import LogNorm
 
@@ -20,12 +23,62 @@ G = 6.67430e-11
 c = 299792458
 M_sun = 1.989e30
 
+@lru_cache(maxsize=None)
+def _unit_sphere(n):
+    """
+    Unit sphere surface on an n×n (azimuth, polar) grid.
+    
+    Built by broadcasting a column of azimuths against a row of polar
+    angles; z depends on the polar angle only, so it is a view. Cached
+    per n and returned read-only, since every plot shares the arrays.
+    """
+    u = np.linspace(0, 2 * np.pi, n)[:, None]
+    v = np.linspace(0, np.pi, n)[None, :]
+    sin_v = np.sin(v)
+    x_sphere = np.cos(u) * sin_v
+    y_sphere = np.sin(u) * sin_v
+    z_sphere = np.broadcast_to(np.cos(v), x_sphere.shape)
+    x_sphere.flags.writeable = False
+    y_sphere.flags.writeable = False
+    return x_sphere, y_sphere, z_sphere
+
+@lru_cache(maxsize=8)
+def _radial_profile(r_s):
+    """
+    μ and τ along 1000 log-spaced radii from 0.01 r_s to 5 r_s.
+    
+    Depends on r_s alone, so instances of the same mass share one
+    read-only copy. The grid is built in r_s units and scaled once.
+    
+    Returns:
+        (r/r_s, r, μ, τ) arrays
+    """
+    r_profile_rs = np.logspace(-2, np.log10(5), 1000, dtype=np.float32)
+    r_profile = r_profile_rs * r_s
+    mu_profile = np.maximum(r_profile * (0.5 / r_s), 1e-6)
+    tau_profile = (2.0 * r_s) / np.maximum(r_profile, r_s * 1e-6)
+    profile = (r_profile_rs, r_profile, mu_profile, tau_profile)
+    for array in profile:
+        array.flags.writeable = False
+    return profile
+
 class DynamicBlackHole3D:
     """Dynamic 3D visualization of black hole change flow."""
     
     def __init__(self, mass=10*M_sun):
         self.mass = mass
         self.r_s = 2 * G * mass / (c**2)
+        
+        # Scalar constants shared by every field evaluation and plot
+        self._inv_rs = 1.0 / self.r_s
+        self._inv_two_rs = 0.5 / self.r_s
+        self._two_rs = 2.0 * self.r_s
+        self._r_min = self.r_s * 1e-6  # Radius floor for τ at the singularity
+        
+        # Radial profile from 0.01 r_s to 5 r_s, shared by every instance
+        # of the same mass
+        (self._r_profile_rs, self._r_profile,
+         self._mu_profile, self._tau_profile) = _radial_profile(self.r_s)
         print(f"🌌 Dynamic 3D Black Hole Visualization")
         print(f"Mass: {mass/M_sun:.1f} M☉")
         print(f"Schwarzschild Radius: {self.r_s:.2e} m")
@@ -34,34 +87,41 @@ class DynamicBlackHole3D:
     
     def mu_field(self, r):
         """Calculate μ = r/(2r_s)"""
-        return np.maximum(r / (2 * self.r_s), 1e-6)
+        return np.maximum(r * self._inv_two_rs, 1e-6)
     
     def tau_field(self, r):
         """Calculate τ = 2r_s/r"""
-        return 2 * self.r_s / np.maximum(r, self.r_s * 1e-6)
+        return self._two_rs / np.maximum(r, self._r_min)
     
-    def create_change_flow_vectors(self, grid_size=20):
-        """Create vector field showing change flow direction."""
-        # Create spherical grid
+    def create_change_flow_vectors(self, grid_size=20, dtype=np.float32):
+        """
+        Create vector field showing change flow direction.
+        
+        Args:
+            grid_size: Points per axis before taking every other one
+            dtype: Grid and field dtype; float32 halves memory traffic and
+                is all the plots need
+        """
+        # Create spherical grid of vector positions (every other point);
+        # ogrid keeps the axes 1D and everything below broadcasts from them
         max_r = self.r_s * 3
-        x = np.linspace(-max_r, max_r, grid_size)
-        y = np.linspace(-max_r, max_r, grid_size)
-        z = np.linspace(-max_r, max_r, grid_size)
-        
-        # Create subset for vectors (every other point)
-        step = 2
-        X, Y, Z = np.meshgrid(x[::step], y[::step], z[::step])
+        n = grid_size // 2 * 1j
+        X, Y, Z = (axis.astype(dtype) for axis in
+                   np.ogrid[-max_r:max_r:n, -max_r:max_r:n, -max_r:max_r:n])
         
-        # Calculate radius
-        R = np.sqrt(X**2 + Y**2 + Z**2)
+        # Calculate radius (the squared terms of the 1D axes are tiny; only
+        # their sum is grid-sized, and the square root runs in place on it)
+        R = X*X + Y*Y + Z*Z
+        np.sqrt(R, out=R)
         
         # Change flows radially inward, magnitude proportional to μ
         mu_values = self.mu_field(R)
         
         # Vector components (pointing toward center, scaled by μ)
-        U = -mu_values * X / np.maximum(R, 1e-10)
-        V = -mu_values * Y / np.maximum(R, 1e-10)
-        W = -mu_values * Z / np.maximum(R, 1e-10)
+        factor = -mu_values / np.maximum(R, 1e-10)
+        U = factor * X
+        V = factor * Y
+        W = factor * Z
         
         return X, Y, Z, U, V, W, mu_values
     
@@ -76,20 +136,18 @@ class DynamicBlackHole3D:
         X, Y, Z, U, V, W, mu_values = self.create_change_flow_vectors()
         
         # Convert to Schwarzschild radius units
-        X_rs = X / self.r_s
-        Y_rs = Y / self.r_s
-        Z_rs = Z / self.r_s
+        X_rs = X * self._inv_rs
+        Y_rs = Y * self._inv_rs
+        Z_rs = Z * self._inv_rs
         
-        # Plot vectors colored by μ value
-        ax.quiver(X_rs, Y_rs, Z_rs, U, V, W, 
-                 c=mu_values, cmap='viridis', alpha=0.6, length=0.3)
+        # Plot vectors colored by μ value (quiver broadcasts the grid axes;
+        # each arrow is a shaft plus two head lines, so μ repeats per part)
+        arrows = ax.quiver(X_rs, Y_rs, Z_rs, U, V, W,
+                           cmap='viridis', alpha=0.6, length=0.3)
+        arrows.set_array(np.tile(mu_values.ravel(), 3))
         
         # Add event horizon sphere
-        u = np.linspace(0, 2 * np.pi, 50)
-        v = np.linspace(0, np.pi, 50)
-        x_sphere = np.outer(np.cos(u), np.sin(v))
-        y_sphere = np.outer(np.sin(u), np.sin(v))
-        z_sphere = np.outer(np.ones(np.size(u)), np.cos(v))
+        x_sphere, y_sphere, z_sphere = _unit_sphere(50)
         
         ax.plot_surface(x_sphere, y_sphere, z_sphere, alpha=0.3, color='red')
         
@@ -104,14 +162,14 @@ class DynamicBlackHole3D:
         # Create 2D cross-section
         grid_2d = 100
         max_r_2d = self.r_s * 3
-        x_2d = np.linspace(-max_r_2d, max_r_2d, grid_2d)
-        y_2d = np.linspace(-max_r_2d, max_r_2d, grid_2d)
-        X_2d, Y_2d = np.meshgrid(x_2d, y_2d)
-        R_2d = np.sqrt(X_2d**2 + Y_2d**2)
+        x_2d = np.linspace(-max_r_2d, max_r_2d, grid_2d, dtype=np.float32)
+        y_2d = np.linspace(-max_r_2d, max_r_2d, grid_2d, dtype=np.float32)
+        X_2d, Y_2d = np.meshgrid(x_2d, y_2d, sparse=True)
+        R_2d = np.hypot(X_2d, Y_2d)
         
         mu_2d = self.mu_field(R_2d)
         
-        im = ax2.contourf(X_2d/self.r_s, Y_2d/self.r_s, mu_2d, levels=50, cmap='viridis')
+        im = ax2.contourf(x_2d * self._inv_rs, y_2d * self._inv_rs, mu_2d, levels=50, cmap='viridis')
         ax2.add_patch(plt.Circle((0, 0), 1, fill=False, color='red', linewidth=2))
         ax2.set_xlabel('x/r_s')
         ax2.set_ylabel('y/r_s')
@@ -121,11 +179,11 @@ class DynamicBlackHole3D:
         # Radial profile
         ax3 = fig.add_subplot(223)
         
-        r_profile = np.logspace(np.log10(self.r_s * 0.01), np.log10(self.r_s * 5), 1000)
-        mu_profile = self.mu_field(r_profile)
-        tau_profile = self.tau_field(r_profile)
+        r_profile_rs = self._r_profile_rs
+        mu_profile = self._mu_profile
+        tau_profile = self._tau_profile
         
-        ax3.loglog(r_profile/self.r_s, mu_profile, 'b-', linewidth=3, label='μ = r/(2r_s)')
+        ax3.loglog(r_profile_rs, mu_profile, 'b-', linewidth=3, label='μ = r/(2r_s)')
         ax3.axvline(x=1, color='red', linestyle='--', alpha=0.7, label='Event Horizon')
         ax3.set_xlabel('r/r_s')
         ax3.set_ylabel('μ')
@@ -136,7 +194,7 @@ class DynamicBlackHole3D:
         # Time dilation profile
         ax4 = fig.add_subplot(224)
         
-        ax4.loglog(r_profile/self.r_s, tau_profile, 'r-', linewidth=3, label='τ = 2r_s/r')
+        ax4.loglog(r_profile_rs, tau_profile, 'r-', linewidth=3, label='τ = 2r_s/r')
         ax4.axvline(x=1, color='red', linestyle='--', alpha=0.7, label='Event Horizon')
         ax4.set_xlabel('r/r_s')
         ax4.set_ylabel('τ')
@@ -157,21 +215,25 @@ class DynamicBlackHole3D:
         # 2D streamline plot
         ax1 = fig.add_subplot(211)
         
-        # Create 2D grid for streamlines
-        max_r = self.r_s * 2.5
-        x = np.linspace(-max_r, max_r, 50)
-        y = np.linspace(-max_r, max_r, 50)
-        X, Y = np.meshgrid(x, y)
+        # Create 2D grid for streamlines, directly in r_s units: the flow
+        # field is radial, so U, V are the same as in meters and
+        # μ = r/(2r_s) becomes R/2
+        x = np.linspace(-2.5, 2.5, 50, dtype=np.float32)
+        y = np.linspace(-2.5, 2.5, 50, dtype=np.float32)
         
-        R = np.sqrt(X**2 + Y**2)
-        mu_values = self.mu_field(R)
+        # Sparse (1, n) and (n, 1) axes; the fields broadcast to full size
+        X, Y = np.meshgrid(x, y, sparse=True)
+        R = np.hypot(X, Y)
+        mu_values = np.maximum(0.5 * R, 1e-6)
         
-        # Velocity components (change flows toward center)
-        U = -mu_values * X / np.maximum(R, 1e-10)
-        V = -mu_values * Y / np.maximum(R, 1e-10)
+        # Velocity components (change flows toward center); the
+        # clamped 1/R and the -μ scale are shared by both
+        factor = -mu_values / np.maximum(R, 1e-10)
+        U = factor * X
+        V = factor * Y
         
         # Create streamlines
-        ax1.streamplot(X/self.r_s, Y/self.r_s, U, V, color=mu_values, 
+        ax1.streamplot(x, y, U, V, color=mu_values, 
                       cmap='viridis', density=2, linewidth=1.5)
         
         # Add event horizon
@@ -191,33 +253,26 @@ class DynamicBlackHole3D:
         n_trajectories = 20
         angles = np.linspace(0, 2*np.pi, n_trajectories)
         
-        for angle in angles:
-            # Start from outside event horizon
-            r_start = self.r_s * 2.5
-            x_start = r_start * np.cos(angle)
-            y_start = r_start * np.sin(angle)
-            z_start = 0
-            
-            # Integrate trajectory toward center
-            trajectory_points = 100
-            r_traj = np.linspace(r_start, self.r_s * 0.1, trajectory_points)
-            
-            x_traj = x_start * r_traj / r_start
-            y_traj = y_start * r_traj / r_start
-            z_traj = np.zeros_like(r_traj)
-            
-            # Color by μ value
-            mu_traj = self.mu_field(r_traj)
-            
-            ax2.plot(x_traj/self.r_s, y_traj/self.r_s, z_traj/self.r_s, 
-                    c=plt.cm.viridis(mu_traj[0]), alpha=0.7, linewidth=2)
+        # Start from outside event horizon and run straight toward the
+        # center; every trajectory is built at once as a (n, points, 3) array
+        r_start = self.r_s * 2.5
+        trajectory_points = 100
+        r_traj = np.linspace(r_start, self.r_s * 0.1, trajectory_points, dtype=np.float32)
+        r_traj_rs = r_traj * self._inv_rs
+        
+        trajectories = np.zeros((n_trajectories, trajectory_points, 3), dtype=np.float32)
+        trajectories[..., 0] = np.cos(angles)[:, None] * r_traj_rs
+        trajectories[..., 1] = np.sin(angles)[:, None] * r_traj_rs
+        
+        # Color by μ value at the starting radius; every trajectory starts
+        # at r_start, so one colormap lookup colors the whole collection
+        start_color = plt.cm.viridis(self.mu_field(r_start))
+        
+        ax2.add_collection3d(Line3DCollection(trajectories, colors=start_color,
+                                              alpha=0.7, linewidth=2))
         
         # Add event horizon sphere
-        u = np.linspace(0, 2 * np.pi, 30)
-        v = np.linspace(0, np.pi, 30)
-        x_sphere = np.outer(np.cos(u), np.sin(v))
-        y_sphere = np.outer(np.sin(u), np.sin(v))
-        z_sphere = np.outer(np.ones(np.size(u)), np.cos(v))
+        x_sphere, y_sphere, z_sphere = _unit_sphere(30)
         
         ax2.plot_surface(x_sphere, y_sphere, z_sphere, alpha=0.3, color='red')
         
@@ -248,11 +303,13 @@ class DynamicBlackHole3D:
         print(f"{'Location':<20} {'r/r_s':<10} {'μ':<12} {'Flow Speed':<12} {'τ':<12}")
         print("-" * 75)
         
-        for name, radius in locations.items():
-            mu = self.mu_field(radius)
-            tau = self.tau_field(radius)
-            flow_speed = mu  # Change flow speed proportional to μ
-            
+        # Evaluate every location in one field call each
+        radii = np.array(list(locations.values()))
+        mus = self.mu_field(radii)
+        taus = self.tau_field(radii)
+        flow_speeds = mus  # Change flow speed proportional to μ
+        
+        for name, radius, mu, flow_speed, tau in zip(locations, radii, mus, flow_speeds, taus):
             print(f"{name:<20} {radius/self.r_s:<10.2f} {mu:<12.6f} {flow_speed:<12.6f} {tau:<12.2f}")
         
         print()
@@ -6,7 +6,14 @@ Predicts time dilation effects in Earth's gravitational field
 at various altitudes using the universal change framework.
 """
 
+import os
 import numpy as np
+import matplotlib
+
+# Automated runs (run_all_tests.py) set MU_HEADLESS: render off-screen and skip plt.show()
+HEADLESS = bool(os.environ.get('MU_HEADLESS'))
+if HEADLESS:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from time_dilation_visualizer.core.universal_change import UniversalChangeCalculator, PhysicsParameters
 
@@ -22,10 +29,15 @@ class NearEarthSimulation:
     def __init__(self):
         self.calculator = UniversalChangeCalculator()
         
+        # Earth constants shared by every altitude evaluation
+        self._GM = G * M_earth
+        self._r_s = 2 * self._GM / (c**2)  # Schwarzschild radius for reference
+        self._phi_surface = -self._GM / R_earth
+        
     def calculate_gravitational_potential(self, altitude: float) -> float:
         """Calculate gravitational potential at given altitude."""
         r = R_earth + altitude
-        return -G * M_earth / r
+        return -self._GM / r
     
     def calculate_energy_density(self, altitude: float) -> float:
         """
@@ -34,7 +46,7 @@ class NearEarthSimulation:
         """
         r = R_earth + altitude
         # Gravitational field strength: g = GM/r²
-        g = G * M_earth / (r**2)
+        g = self._GM / (r**2)
         
         # Energy density proportional to field strength
         # Scale factor to get reasonable μ values
@@ -47,57 +59,76 @@ class NearEarthSimulation:
         Higher curvature = higher resistance to change.
         """
         r = R_earth + altitude
-        # Schwarzschild radius for reference
-        r_s = 2 * G * M_earth / (c**2)
         
         # Resistance increases as we approach the surface (higher curvature)
         # χ ∝ 1/(1 - r_s/r) but scaled for near-Earth conditions
-        curvature_factor = 1 / (1 - r_s/(2*r))  # Modified for weak field
+        curvature_factor = 1 / (1 - self._r_s/(2*r))  # Modified for weak field
         chi = curvature_factor * 1e-6  # Scaled resistance
         return chi
     
-    def predict_time_dilation(self, altitude: float) -> dict:
+    def predict_time_dilation_profile(self, altitudes: np.ndarray) -> dict:
         """
-        Predict time dilation at given altitude using μ = ρ/χ = 1/τ
+        Predict time dilation at many altitudes at once using μ = ρ/χ = 1/τ
         
         Args:
-            altitude: Height above Earth surface (meters)
+            altitudes: Heights above Earth surface (meters)
             
         Returns:
-            Dictionary with μ, τ, and analysis
+            Dictionary of arrays with μ, τ, and analysis per altitude
         """
-        # Calculate energy density and resistance
-        rho = self.calculate_energy_density(altitude)
-        chi = self.calculate_resistance_to_change(altitude)
+        altitudes = np.asarray(altitudes, dtype=float)
+        tolerance = self.calculator.tolerance
         
-        # Calculate μ using gravitational formulation
-        mu = self.calculator.calculate_mu_gravitational(rho, chi)
+        # Calculate energy density and resistance (both are plain arithmetic
+        # in r, so they evaluate the whole array in one pass)
+        rho = self.calculate_energy_density(altitudes)
+        chi = self.calculate_resistance_to_change(altitudes)
         
-        # Calculate time dilation factor
-        tau = self.calculator.calculate_tau_from_mu(mu)
+        # μ = ρ/χ and τ = 1/μ, with the calculator's near-zero limits
+        with np.errstate(divide='ignore'):
+            mu = np.where(np.abs(chi) < tolerance, np.inf, rho / chi)
+            tau = np.where(np.abs(mu) < tolerance, np.inf, 1.0 / mu)
         
         # Compare with Einstein's prediction for validation
-        r = R_earth + altitude
-        phi_surface = -G * M_earth / R_earth
-        phi_altitude = -G * M_earth / r
+        phi_altitude = self.calculate_gravitational_potential(altitudes)
         
         # Einstein's time dilation: τ_einstein ≈ 1 + (φ_alt - φ_surf)/c²
-        tau_einstein = 1 + (phi_altitude - phi_surface) / (c**2)
+        tau_einstein = 1 + (phi_altitude - self._phi_surface) / (c**2)
         
         return {
-            'altitude': altitude,
+            'altitude': altitudes,
             'rho': rho,
             'chi': chi,
             'mu': mu,
             'tau': tau,
             'tau_einstein': tau_einstein,
-            'difference_percent': abs(tau - tau_einstein) / tau_einstein * 100
+            'difference_percent': np.abs(tau - tau_einstein) / tau_einstein * 100
         }
     
+    def predict_time_dilation(self, altitude: float) -> dict:
+        """
+        Predict time dilation at given altitude using μ = ρ/χ = 1/τ
+        
+        Args:
+            altitude: Height above Earth surface (meters)
+            
+        Returns:
+            Dictionary with μ, τ, and analysis
+        """
+        profile = self.predict_time_dilation_profile(np.array([altitude]))
+        result = {key: float(values[0]) for key, values in profile.items()}
+        result['altitude'] = altitude
+        return result
+    
     def run_altitude_sweep(self, max_altitude: float = 1000e3, num_points: int = 100):
-        """Run simulation across range of altitudes."""
+        """
+        Run simulation across range of altitudes.
+        
+        Returns:
+            Dictionary of per-altitude arrays (see predict_time_dilation_profile)
+        """
         altitudes = np.linspace(0, max_altitude, num_points)
-        results = []
+        results = self.predict_time_dilation_profile(altitudes)
         
         print("🌍 Near-Earth Time Dilation Simulation")
         print("=" * 50)
@@ -105,27 +136,25 @@ class NearEarthSimulation:
         print(f"Altitude range: 0 to {max_altitude/1000:.0f} km")
         print()
         
-        for alt in altitudes:
-            result = self.predict_time_dilation(alt)
-            results.append(result)
-            
-            # Print some key altitudes
-            if alt in [0, 100e3, 400e3, 1000e3] or alt == altitudes[-1]:
-                print(f"Altitude: {alt/1000:6.0f} km")
-                print(f"  μ (change flow): {result['mu']:.6e}")
-                print(f"  τ (time dilation): {result['tau']:.10f}")
-                print(f"  Einstein τ: {result['tau_einstein']:.10f}")
-                print(f"  Difference: {result['difference_percent']:.3f}%")
-                print()
+        # Print some key altitudes
+        is_key = np.isin(altitudes, [0, 100e3, 400e3, 1000e3])
+        is_key[-1] = True
+        for i in np.flatnonzero(is_key):
+            print(f"Altitude: {altitudes[i]/1000:6.0f} km")
+            print(f"  μ (change flow): {results['mu'][i]:.6e}")
+            print(f"  τ (time dilation): {results['tau'][i]:.10f}")
+            print(f"  Einstein τ: {results['tau_einstein'][i]:.10f}")
+            print(f"  Difference: {results['difference_percent'][i]:.3f}%")
+            print()
         
         return results
     
     def plot_results(self, results):
         """Plot time dilation vs altitude."""
-        altitudes = [r['altitude']/1000 for r in results]  # Convert to km
-        tau_values = [r['tau'] for r in results]
-        tau_einstein = [r['tau_einstein'] for r in results]
-        mu_values = [r['mu'] for r in results]
+        altitudes = results['altitude'] / 1000  # Convert to km
+        tau_values = results['tau']
+        tau_einstein = results['tau_einstein']
+        mu_values = results['mu']
         
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
@@ -138,16 +167,20 @@ class NearEarthSimulation:
         ax1.grid(True, alpha=0.3)
         ax1.legend()
         
-        # Add annotations for key altitudes
-        key_alts = [0, 100, 400, 1000]  # km
-        for alt_km in key_alts:
-            if alt_km <= max(altitudes):
-                idx = min(range(len(altitudes)), key=lambda i: abs(altitudes[i] - alt_km))
-                ax1.annotate(f'{alt_km} km\nτ = {tau_values[idx]:.8f}', 
-                           xy=(altitudes[idx], tau_values[idx]),
-                           xytext=(10, 10), textcoords='offset points',
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
-                           fontsize=8)
+        # Add annotations for key altitudes, at the nearest sample of each
+        # (binary search on the sorted altitudes, then the closer neighbor)
+        key_alts = np.array([0, 100, 400, 1000])  # km
+        key_alts = key_alts[key_alts <= altitudes.max()]
+        after = np.searchsorted(altitudes, key_alts).clip(0, len(altitudes) - 1)
+        before = (after - 1).clip(0)
+        nearest = np.where(np.abs(altitudes[before] - key_alts) <= np.abs(altitudes[after] - key_alts),
+                           before, after)
+        for alt_km, idx in zip(key_alts, nearest):
+            ax1.annotate(f'{alt_km} km\nτ = {tau_values[idx]:.8f}', 
+                       xy=(altitudes[idx], tau_values[idx]),
+                       xytext=(10, 10), textcoords='offset points',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
+                       fontsize=8)
         
         # Plot 2: Change flow rate μ
         ax2.semilogy(altitudes, mu_values, 'g-', linewidth=2, label='μ = ρ/χ')
@@ -158,7 +191,8 @@ class NearEarthSimulation:
         ax2.legend()
         
         plt.tight_layout()
-        plt.show()
+        if not HEADLESS:
+            plt.show()
         
         return fig
 
@@ -6,6 +6,7 @@ Comprehensive test suite runner with reporting
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 def run_tests():
     """Run all tests and generate report."""
@@ -43,15 +44,28 @@ def run_simulations():
     
     all_passed = True
     
-    for name, script in simulations:
-        print(f"\nTesting {name} simulation...")
-        try:
-            result = subprocess.run(
+    # Headless mode: the scripts switch to Agg and skip plt.show()
+    env = dict(os.environ, MU_HEADLESS="1", MPLBACKEND="Agg")
+    
+    # The simulations are independent, so run them all at once; results
+    # are still reported in the order listed above
+    with ThreadPoolExecutor(max_workers=len(simulations)) as executor:
+        futures = [
+            (name, executor.submit(
+                subprocess.run,
                 [sys.executable, script],
                 capture_output=True,
                 timeout=30,
-                text=True
-            )
+                text=True,
+                env=env
+            ))
+            for name, script in simulations
+        ]
+    
+    for name, future in futures:
+        print(f"\nTesting {name} simulation...")
+        try:
+            result = future.result()
             
             if result.returncode == 0:
                 print(f"  ✅ {name} simulation completed successfully")
@@ -6,20 +6,24 @@ Creates clear 3D visualizations without complex matplotlib features.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; NumPy ufuncs are used instead
+    ne = None
 
 # Physical constants
 G = 6.67430e-11
 c = 299792458
 M_sun = 1.989e30
+C2 = c * c
 
 class Simple3DBlackHole:
     """Simple 3D black hole visualization."""
     
     def __init__(self, mass=10*M_sun):
         self.mass = mass
-        self.r_s = 2 * G * mass / (c**2)
+        self.r_s = 2 * G * mass / C2
         print(f"🕳️ Simple 3D Black Hole Visualization")
         print(f"Mass: {mass/M_sun:.1f} Solar Masses")
         print(f"Schwarzschild Radius: {self.r_s:.2e} meters")
@@ -36,6 +40,10 @@ class Simple3DBlackHole:
     
     def create_spherical_shells(self):
         """Create 3D spherical shells showing μ levels."""
+        # matplotlib is imported per plot, so the module stays cheap to import
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D
+        
         fig = plt.figure(figsize=(15, 12))
         
         # Create 4 subplots for different views
@@ -49,28 +57,20 @@ class Simple3DBlackHole:
         colors = ['red', 'orange', 'yellow', 'white']
         labels = ['Event Horizon (μ=0.5)', 'μ=0.25', 'μ=0.125', 'μ=0.0625']
         
-        # Create spherical coordinates
+        # Create spherical coordinates; the unit sphere is shared by every shell
         u = np.linspace(0, 2 * np.pi, 30)
         v = np.linspace(0, np.pi, 20)
+        sin_v = np.sin(v)
+        cos_v = np.cos(v)
+        sx = np.outer(np.cos(u), sin_v)
+        sy = np.outer(np.sin(u), sin_v)
+        sz = np.broadcast_to(cos_v, (u.size, v.size))  # z depends on the polar angle only
         
         axes = [ax1, ax2, ax3, ax4]
         titles = ['Nested μ Shells', 'Event Horizon Detail', 'Interior Structure', 'Near Singularity']
         
         for i, ax in enumerate(axes):
             for j, (mu_level, color, label) in enumerate(zip(mu_levels, colors, labels)):
-                # Calculate radius for this μ level: r = 2r_s * μ
-                radius = 2 * self.r_s * mu_level
-                
-                # Create sphere coordinates
-                x = radius * np.outer(np.cos(u), np.sin(v))
-                y = radius * np.outer(np.sin(u), np.sin(v))
-                z = radius * np.outer(np.ones(np.size(u)), np.cos(v))
-                
-                # Convert to Schwarzschild radius units
-                x_rs = x / self.r_s
-                y_rs = y / self.r_s
-                z_rs = z / self.r_s
-                
                 # Plot sphere with different transparency for each view
                 alpha = 0.3 if i == 0 else 0.5
                 if i == 1 and j > 0:  # Event horizon detail - skip inner shells
@@ -80,6 +80,13 @@ class Simple3DBlackHole:
                 if i == 3 and j < 2:  # Near singularity - only innermost shells
                     continue
                 
+                # Radius for this μ level is r = 2r_s * μ, so in
+                # Schwarzschild radius units it is just 2μ
+                radius_rs = 2 * mu_level
+                x_rs = radius_rs * sx
+                y_rs = radius_rs * sy
+                z_rs = radius_rs * sz
+                
                 ax.plot_surface(x_rs, y_rs, z_rs, alpha=alpha, color=color, label=label)
             
             ax.set_xlabel('x/r_s')
@@ -113,6 +120,8 @@ class Simple3DBlackHole:
     
     def plot_cross_sections_3d(self):
         """Plot multiple cross-sections in 3D."""
+        import matplotlib.pyplot as plt
+        
         fig = plt.figure(figsize=(15, 10))
         
         # Create 2D cross-sections at different z-levels
@@ -126,22 +135,29 @@ class Simple3DBlackHole:
         axes = [ax1, ax2, ax3, ax4, ax5, ax6]
         z_levels = [0, 0.2, 0.4, 0.6, 0.8, 1.0]  # Different z/r_s levels
         
-        # Create 2D grid
+        # Create 2D grid; r² in the plane is shared by every slice
         max_r = self.r_s * 2
         x = np.linspace(-max_r, max_r, 100)
         y = np.linspace(-max_r, max_r, 100)
-        X, Y = np.meshgrid(x, y)
+        r2_xy = y[:, None]**2 + x[None, :]**2
+        
+        # μ field for all z-levels at once, shape (levels, y, x)
+        zs = np.array(z_levels) * self.r_s
+        zs2 = (zs**2)[:, None, None]
+        if ne is not None:
+            # One fused, multithreaded pass instead of a temporary per ufunc
+            mu_all = ne.evaluate("sqrt(r2_xy + zs2) * half_inv_rs",
+                                 local_dict={'r2_xy': r2_xy[None, :, :], 'zs2': zs2,
+                                             'half_inv_rs': 0.5 / self.r_s})
+            np.maximum(mu_all, 1e-6, out=mu_all)  # same floor as mu_field
+        else:
+            mu_all = self.mu_field(np.sqrt(r2_xy + zs2))
+        x_rs = x / self.r_s
+        y_rs = y / self.r_s
         
         for i, (ax, z_level) in enumerate(zip(axes, z_levels)):
-            # Calculate radius including z component
-            Z = np.full_like(X, z_level * self.r_s)
-            R = np.sqrt(X**2 + Y**2 + Z**2)
-            
-            # Calculate μ field
-            mu_field = self.mu_field(R)
-            
-            # Plot contours
-            contour = ax.contourf(X/self.r_s, Y/self.r_s, mu_field, levels=20, cmap='viridis')
+            # Plot the dense μ field as a shaded mesh
+            mesh = ax.pcolormesh(x_rs, y_rs, mu_all[i], cmap='viridis', shading='auto')
             
             # Add event horizon circle (adjusted for z-level)
             if z_level < 1.0:
@@ -157,7 +173,7 @@ class Simple3DBlackHole:
             
             # Add colorbar for first plot
             if i == 0:
-                plt.colorbar(contour, ax=ax, label='μ')
+                plt.colorbar(mesh, ax=ax, label='μ')
         
         plt.tight_layout()
         plt.suptitle('3D Cross-Sections: μ Field at Different z-levels', fontsize=16, y=0.98)
@@ -167,17 +183,26 @@ class Simple3DBlackHole:
     
     def create_radial_analysis(self):
         """Create comprehensive radial analysis."""
+        import matplotlib.pyplot as plt
+        
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
-        # Create radial array
-        r_array = np.logspace(np.log10(self.r_s * 0.001), np.log10(self.r_s * 5), 1000)
-        r_rs = r_array / self.r_s
+        # Create radial array; every profile is a power law in r, so 300
+        # log-spaced points are more than the loglog axes can resolve
+        r_array = np.logspace(np.log10(self.r_s * 0.001), np.log10(self.r_s * 5), 300)
         
-        # Calculate fields
-        mu_values = self.mu_field(r_array)
-        tau_values = self.tau_field(r_array)
-        rho_values = G * self.mass / (r_array**3 * c**2)
-        chi_values = (self.r_s / r_array)**2
+        # Calculate fields; r_array starts at 0.001 r_s, so the
+        # field-method clamps are never active here
+        # Shared temporaries instead of recomputing powers of r
+        inv_r = np.reciprocal(r_array)
+        r_rs = r_array * (1.0 / self.r_s)
+        mu_values = np.multiply(r_rs, 0.5)
+        tau_values = np.reciprocal(mu_values)
+        rho_values = np.multiply(inv_r, inv_r)
+        rho_values *= inv_r
+        rho_values *= G * self.mass / C2
+        chi_values = np.multiply(inv_r, self.r_s)
+        chi_values *= chi_values
         
         # Plot 1: μ vs radius
         ax1.loglog(r_rs, mu_values, 'b-', linewidth=3, label='μ = r/(2r_s)')
@@ -3,9 +3,14 @@ Simple Near-Earth Time Dilation Simulation
 Using Universal Change Equation: μ = ρ/χ = 1/τ
 """
 
-import sys
-import os
-sys.path.append('.')
+from importlib.util import find_spec
+
+import numpy as np
+
+# numba is optional and costs about a second to import, so it is only
+# imported once an array is large enough to pay that back
+HAVE_NUMBA = find_spec('numba') is not None
+NUMBA_MIN_SIZE = 5_000_000
 
 # Physical constants
 G = 6.67430e-11  # Gravitational constant (m³/kg⋅s²)
@@ -13,55 +18,105 @@ M_earth = 5.972e24  # Earth mass (kg)
 R_earth = 6.371e6  # Earth radius (m)
 c = 299792458  # Speed of light (m/s)
 
-class SimpleUniversalChange:
-    """Simplified universal change calculator."""
-    
-    def calculate_mu_gravitational(self, rho, chi):
-        """Calculate μ = ρ/χ for gravitational scenarios."""
-        if abs(chi) < 1e-15:
-            return float('inf')
-        return rho / chi
-    
-    def calculate_tau_from_mu(self, mu):
-        """Calculate τ = 1/μ."""
-        if abs(mu) < 1e-15:
-            return float('inf')
-        return 1.0 / mu
+# Altitude-independent quantities, computed once at module load
+R_S_EARTH = 2 * G * M_earth / (c * c)  # Schwarzschild radius
+PHI_SURFACE_EARTH = -G * M_earth / R_earth  # Surface potential
+INV_C2 = 1.0 / (c * c)
 
 def calculate_energy_density(altitude):
-    """Calculate energy density ρ in Earth's gravitational field."""
+    """Calculate energy density ρ in Earth's gravitational field (altitude: scalar or array)."""
     r = R_earth + altitude
-    g = G * M_earth / (r**2)  # Gravitational field strength
+    g = G * M_earth / (r * r)  # Gravitational field strength
     rho = g * 1e-9  # Scaled energy density
     return rho
 
 def calculate_resistance_to_change(altitude):
-    """Calculate χ (resistance to change) based on spacetime curvature."""
+    """Calculate χ (resistance to change) based on spacetime curvature (altitude: scalar or array)."""
     r = R_earth + altitude
-    r_s = 2 * G * M_earth / (c**2)  # Schwarzschild radius
-    curvature_factor = 1 / (1 - r_s/(2*r))  # Modified for weak field
+    curvature_factor = 1 / (1 - R_S_EARTH/(2*r))  # Modified for weak field
     chi = curvature_factor * 1e-6  # Scaled resistance
     return chi
 
-def predict_time_dilation(altitude):
-    """Predict time dilation at given altitude using μ = ρ/χ = 1/τ"""
-    calc = SimpleUniversalChange()
-    
-    # Calculate energy density and resistance
-    rho = calculate_energy_density(altitude)
-    chi = calculate_resistance_to_change(altitude)
-    
-    # Calculate μ using gravitational formulation
-    mu = calc.calculate_mu_gravitational(rho, chi)
-    
-    # Calculate time dilation factor
-    tau = calc.calculate_tau_from_mu(mu)
-    
-    # Compare with Einstein's prediction
+def _predict_kernel(altitude):
+    """Scalar ρ, χ, μ, τ and Einstein τ at one altitude, flattened into plain float math."""
     r = R_earth + altitude
-    phi_surface = -G * M_earth / R_earth
-    phi_altitude = -G * M_earth / r
-    tau_einstein = 1 + (phi_altitude - phi_surface) / (c**2)
+    rho = G * M_earth / (r * r) * 1e-9
+    chi = 1 / (1 - R_S_EARTH/(2*r)) * 1e-6
+    mu = np.inf if abs(chi) < 1e-15 else rho / chi
+    tau = np.inf if abs(mu) < 1e-15 else 1.0 / mu
+    tau_einstein = 1 + (-G * M_earth / r - PHI_SURFACE_EARTH) * INV_C2
+    return rho, chi, mu, tau, tau_einstein
+
+_predict_kernel_jit = None
+_predict_batch = None
+
+def _get_predict_batch():
+    """Import numba and compile (or load from its disk cache) the batch kernel once."""
+    global _predict_kernel_jit, _predict_batch
+    if _predict_batch is None:
+        from numba import njit, prange
+        
+        # A module global rather than a closure, so the batch kernel stays cacheable
+        _predict_kernel_jit = njit(cache=True)(_predict_kernel)
+        
+        @njit(parallel=True, cache=True)
+        def batch(altitudes, out_rho, out_chi, out_mu, out_tau, out_tau_einstein):
+            """Run _predict_kernel over an altitude array, rows split across threads."""
+            for i in prange(altitudes.shape[0]):
+                rho, chi, mu, tau, tau_einstein = _predict_kernel_jit(altitudes[i])
+                out_rho[i] = rho
+                out_chi[i] = chi
+                out_mu[i] = mu
+                out_tau[i] = tau
+                out_tau_einstein[i] = tau_einstein
+        
+        _predict_batch = batch
+    return _predict_batch
+
+def predict_time_dilation(altitude):
+    """
+    Predict time dilation at given altitude using μ = ρ/χ = 1/τ
+    
+    Args:
+        altitude: Height above the surface (m), scalar or array; every
+            result entry then has the same shape
+    """
+    if np.ndim(altitude) == 0:
+        # Single altitude: plain float math instead of the ufunc machinery
+        rho, chi, mu, tau, tau_einstein = _predict_kernel(float(altitude))
+        return {
+            'altitude': altitude,
+            'rho': rho,
+            'chi': chi,
+            'mu': mu,
+            'tau': tau,
+            'tau_einstein': tau_einstein,
+            'time_gain_ns_per_s': (tau - 1) * 1e9
+        }
+    
+    altitude = np.asarray(altitude, dtype=float)
+    
+    if HAVE_NUMBA and altitude.size >= NUMBA_MIN_SIZE:
+        # Compiled kernel per row, rows in parallel; the kernel works on flat
+        # C-ordered buffers, which are reshaped back to the input's shape
+        flat = np.ascontiguousarray(altitude).reshape(-1)
+        outputs = [np.empty(flat.size) for _ in range(5)]
+        _get_predict_batch()(flat, *outputs)
+        rho, chi, mu, tau, tau_einstein = (out.reshape(altitude.shape) for out in outputs)
+    else:
+        # Calculate energy density and resistance
+        rho = calculate_energy_density(altitude)
+        chi = calculate_resistance_to_change(altitude)
+        
+        # Calculate μ = ρ/χ and τ = 1/μ; entries below the 1e-15 tolerance
+        # are left at the ∞ fill instead of being divided
+        mu = np.divide(rho, chi, out=np.full_like(rho, np.inf), where=np.abs(chi) >= 1e-15)
+        tau = np.divide(1.0, mu, out=np.full_like(mu, np.inf), where=np.abs(mu) >= 1e-15)
+        
+        # Compare with Einstein's prediction
+        r = R_earth + altitude
+        phi_altitude = -G * M_earth / r
+        tau_einstein = 1 + (phi_altitude - PHI_SURFACE_EARTH) * INV_C2
     
     return {
         'altitude': altitude,
@@ -96,18 +151,22 @@ def main():
         'High Earth Orbit': 1000000
     }
     
-    print("📊 Time Dilation Predictions:")
-    print("-" * 80)
-    print(f"{'Location':<20} {'Alt(km)':<8} {'μ (×10⁻⁶)':<12} {'τ':<15} {'Δt(ns/s)':<10}")
-    print("-" * 80)
-    
-    for name, altitude in test_altitudes.items():
-        result = predict_time_dilation(altitude)
-        
-        print(f"{name:<20} {altitude/1000:<8.1f} {result['mu']*1e6:<12.3f} "
-              f"{result['tau']:<15.10f} {result['time_gain_ns_per_s']:<10.2f}")
-    
-    print("-" * 80)
+    # Every altitude in one vectorized pass
+    alts = np.fromiter(test_altitudes.values(), dtype=np.float64)
+    results = predict_time_dilation(alts)
+    
+    # Render the whole table, then write it in one call
+    lines = ["📊 Time Dilation Predictions:",
+             "-" * 80,
+             f"{'Location':<20} {'Alt(km)':<8} {'μ (×10⁻⁶)':<12} {'τ':<15} {'Δt(ns/s)':<10}",
+             "-" * 80]
+    lines.extend(f"{name:<20} {altitude/1000:<8.1f} {mu*1e6:<12.3f} "
+                 f"{tau:<15.10f} {gain:<10.2f}"
+                 for name, altitude, mu, tau, gain in zip(test_altitudes, test_altitudes.values(),
+                                                          results['mu'], results['tau'],
+                                                          results['time_gain_ns_per_s']))
+    lines.append("-" * 80)
+    print("\n".join(lines))
     print()
     
     # Detailed analysis for ISS
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup for the Mu-Theory test suite
+"""
+
+import sys
+import os
+
+# Add parent directory to path, once per session
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -4,16 +4,15 @@ Tests all formulations of μ and validates predictions
 """
 
 import pytest
+import warnings
 import numpy as np
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from time_dilation_visualizer.core import universal_change
 from time_dilation_visualizer.core.universal_change import (
     UniversalChangeCalculator,
-    PhysicsParameters
+    PhysicsParameters,
+    PhysicsParameterBatch,
+    ParameterError
 )
 
 # Physical constants for testing
@@ -22,14 +21,30 @@ M_earth = 5.972e24
 R_earth = 6.371e6
 c = 299792458
 
+# Derived constants shared across tests
+PHI_SURFACE = -G * M_earth / R_earth
+INV_C2 = 1.0 / (c * c)
+R_S_10MSUN = 2 * G * (10 * 1.989e30) / (c**2)  # Schwarzschild radius, 10 solar masses
+
 class TestUniversalChangeCalculator:
     """Test suite for UniversalChangeCalculator."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def calculator(self):
-        """Create calculator instance for tests."""
+        """Create calculator instance for tests (stateless, so shared per module)."""
         return UniversalChangeCalculator()
     
+    @pytest.fixture(params=["numba", "numpy"])
+    def array_backend(self, request, calculator, monkeypatch):
+        """Route the array methods through each backend, whatever the array size."""
+        if request.param == "numba":
+            if not universal_change.HAVE_NUMBA:
+                pytest.skip("numba not installed")
+            monkeypatch.setattr(calculator, "_NUMBA_MIN_SIZE", 0)
+        else:
+            monkeypatch.setattr(universal_change, "HAVE_NUMBA", False)
+        return request.param
+    
     def test_mu_tau_relationship(self, calculator):
         """Test that μ = 1/τ holds."""
         mu_values = [0.5, 1.0, 2.0, 10.0]
@@ -50,6 +65,47 @@ class TestUniversalChangeCalculator:
         
         assert abs(mu - expected_mu) < 1e-10
     
+    def test_gravitational_mu_array(self, calculator, array_backend):
+        """Test batched μ = ρ/χ against the scalar formulation."""
+        rho = np.array([[1e10, 1e3], [2.5, 7.0]])
+        chi = np.array([[1e6, 1e6], [0.5, 3.0]])
+        
+        mu = calculator.calculate_mu_gravitational_array(rho, chi)
+        
+        expected = [[calculator.calculate_mu_gravitational(r, x) for r, x in zip(rr, xr)]
+                    for rr, xr in zip(rho, chi)]
+        assert mu.shape == (2, 2)
+        assert np.array_equal(mu, expected)
+        
+        # Near-zero χ gives ∞ with a single warning
+        with pytest.warns(UserWarning):
+            mu = calculator.calculate_mu_gravitational_array([1.0, 2.0], [0.0, 4.0])
+        assert mu[0] == float('inf')
+        assert mu[1] == 0.5
+        
+        # Scalar inputs still come back as a (0-d) array
+        mu = calculator.calculate_mu_gravitational_array(1.0, 2.0)
+        assert isinstance(mu, np.ndarray)
+        assert mu == 0.5
+    
+    def test_gravitational_mu_fast(self, calculator, array_backend):
+        """Test the warning-free μ = ρ/χ path for scalars and arrays."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            mu = calculator._mu_gravitational_fast(np.array([1.0, 2.0, 3.0]), np.array([0.0, 4.0, 1e-12]))
+            assert calculator._mu_gravitational_fast(1.0, 0.0) == float('inf')
+        
+        assert np.array_equal(mu, [np.inf, 0.5, np.inf])
+        assert calculator._mu_gravitational_fast(6.0, 3.0) == 2.0
+        
+        # Non-finite χ: NaN and zero both give ∞ (and χ = ∞ gives 0) on every path
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            mu = calculator._mu_gravitational_fast(np.array([1.0, np.nan, 1.0]),
+                                                   np.array([np.nan, 0.0, np.inf]))
+            assert calculator._mu_gravitational_fast(1.0, float('nan')) == float('inf')
+        assert np.array_equal(mu, [np.inf, np.inf, 0.0])
+    
     def test_thermodynamic_mu(self, calculator):
         """Test thermodynamic formulation μ = (ΔS/t)/χ."""
         delta_s = 100  # J/K
@@ -98,12 +154,10 @@ class TestUniversalChangeCalculator:
         h = 408000  # ISS altitude in meters
         
         # Calculate gravitational potential difference
-        phi_surface = -G * M_earth / R_earth
-        phi_iss = -G * M_earth / (R_earth + h)
-        delta_phi = phi_iss - phi_surface
+        delta_phi = -G * M_earth / (R_earth + h) - PHI_SURFACE
         
         # Expected time dilation
-        tau_expected = 1 + delta_phi / (c**2)
+        tau_expected = 1 + delta_phi * INV_C2
         mu_expected = 1 / tau_expected
         
         # Calculate using our theory
@@ -119,11 +173,9 @@ class TestUniversalChangeCalculator:
         """Test GPS satellite time dilation prediction."""
         h = 20200000  # GPS altitude in meters
         
-        phi_surface = -G * M_earth / R_earth
-        phi_gps = -G * M_earth / (R_earth + h)
-        delta_phi = phi_gps - phi_surface
+        delta_phi = -G * M_earth / (R_earth + h) - PHI_SURFACE
         
-        tau_expected = 1 + delta_phi / (c**2)
+        tau_expected = 1 + delta_phi * INV_C2
         mu_expected = 1 / tau_expected
         
         rho = mu_expected
@@ -135,8 +187,7 @@ class TestUniversalChangeCalculator:
     
     def test_black_hole_event_horizon(self, calculator):
         """Test μ = 0.5 at event horizon."""
-        M = 10 * 1.989e30  # 10 solar masses
-        r_s = 2 * G * M / (c**2)
+        r_s = R_S_10MSUN
         
         # At event horizon: μ = r/(2r_s) = r_s/(2r_s) = 0.5
         mu_expected = 0.5
@@ -148,8 +199,7 @@ class TestUniversalChangeCalculator:
     
     def test_black_hole_interior(self, calculator):
         """Test μ = r/(2r_s) inside black hole."""
-        M = 10 * 1.989e30
-        r_s = 2 * G * M / (c**2)
+        r_s = R_S_10MSUN
         
         test_radii = [r_s, r_s/2, r_s/4, r_s/10]
         
@@ -189,6 +239,51 @@ class TestUniversalChangeCalculator:
         assert not is_valid
         assert len(errors) > 0
     
+    def test_parameter_validation_batch(self, calculator):
+        """Test batched validation against per-sample validate_parameters."""
+        arrays = {
+            'epsilon': [1e-3, -1.0, 1e-3, 1e-3],
+            'chi': [1e6, 1e6, 0.0, 1e6],
+            't': 1.0,
+            'rho': [1e3, 1e3, -1.0, 1e3],
+            'mu': [2.0, 2.0, 0.0, 1.0],
+            'tau': [0.5, 0.5, float('inf'), 2.0],
+        }
+        
+        is_valid, codes = calculator.validate_parameters_batch(arrays)
+        
+        assert codes.dtype == np.int8
+        assert list(codes) == [0, ParameterError.EPS_NEG,
+                               ParameterError.CHI_NONPOS | ParameterError.RHO_NEG,
+                               ParameterError.MU_TAU_MISMATCH]
+        for i in range(4):
+            params = PhysicsParameters(**{k: float(np.broadcast_to(v, 4)[i]) for k, v in arrays.items()})
+            assert is_valid[i] == calculator.validate_parameters(params)[0]
+    
+    def test_parameter_batch(self, calculator):
+        """Test the structure-of-arrays parameter container."""
+        batch = PhysicsParameterBatch(chi=[1e6, 1e3, 0.0], rho=1e3, t=[1.0, 2.0, 3.0])
+        
+        assert len(batch) == 3
+        assert len(PhysicsParameterBatch()) == 0
+        assert len(PhysicsParameterBatch(chi=[])) == 0
+        assert batch.chi.dtype == np.float64
+        
+        # Field-wise value equality, without ambiguous array truth values
+        assert batch == PhysicsParameterBatch(chi=[1e6, 1e3, 0.0], rho=1e3, t=[1.0, 2.0, 3.0])
+        assert batch != PhysicsParameterBatch(chi=[1e6, 1e3, 1.0], rho=1e3, t=[1.0, 2.0, 3.0])
+        assert batch != PhysicsParameterBatch(chi=[1e6, 1e3, 0.0], rho=1e3)
+        assert batch.to_params(1) == PhysicsParameters(chi=1e3, rho=1e3, t=2.0)
+        
+        is_valid, codes = calculator.validate_parameters_batch(batch)
+        assert list(is_valid) == [True, True, False]
+        assert codes[2] == ParameterError.CHI_NONPOS
+        
+        chi = batch.chi[:2]
+        results = calculator.simulate_scenarios_batch('black_hole', PhysicsParameterBatch(chi=chi, rho=1e3))
+        expected = calculator.simulate_scenarios_batch('black_hole', {'chi': chi, 'rho': 1e3})
+        assert np.array_equal(results, expected)
+    
     def test_scenario_black_hole(self, calculator):
         """Test black hole scenario simulation."""
         result = calculator.simulate_scenario('black_hole', chi=1e6, rho=1e3)
@@ -206,6 +301,50 @@ class TestUniversalChangeCalculator:
         assert 'tau' in result
         assert result['mu'] > 1  # Should show μ → ∞
     
+    @pytest.mark.parametrize("scenario, param_arrays", [
+        ('black_hole', {'chi': [1e6, 1e3, 2.0], 'rho': [1e3, 1e3, 1e-20]}),
+        ('light_speed', {'epsilon': [1e-10, 1e-3, 1.0], 'nu': 1.0}),
+        ('quantum_vacuum', {'psi_range': (0.0, [1.0, 2.0, 0.5]), 'zeta_range': (0.0, [0.1, 0.2, 1.0])}),
+        ('universe_expansion', {'delta_s': [1e23, 1e20, 5.0], 't': [1e17, 1e10, 2.0], 'chi': 1e6}),
+    ])
+    def test_scenarios_batch(self, calculator, scenario, param_arrays):
+        """Test batched scenario sweeps against per-sample simulate_scenario calls."""
+        results = calculator.simulate_scenarios_batch(scenario, param_arrays)
+        
+        assert results.dtype.names == ('mu', 'tau')
+        assert results.shape == (3,)
+        for i, record in enumerate(results):
+            params = {}
+            for key, value in param_arrays.items():
+                if isinstance(value, tuple):
+                    params[key] = tuple(np.broadcast_to(v, 3)[i] for v in value)
+                else:
+                    params[key] = np.broadcast_to(value, 3)[i]
+            expected = calculator.simulate_scenario(scenario, **params)
+            assert record['mu'] == pytest.approx(expected['mu'], rel=1e-12)
+            assert record['tau'] == pytest.approx(expected['tau'], rel=1e-12)
+    
+    @pytest.mark.parametrize("scenario, param_arrays", [
+        ('black_hole', {}),
+        ('black_hole', {'chi': 1e6, 'rho': 1e3}),
+        ('light_speed', {}),
+        ('quantum_vacuum', {}),
+        ('universe_expansion', {}),
+    ])
+    def test_scenarios_batch_scalar(self, calculator, scenario, param_arrays):
+        """Test batched scenarios with defaults or scalar parameters."""
+        results = calculator.simulate_scenarios_batch(scenario, param_arrays)
+        expected = calculator.simulate_scenario(scenario, **param_arrays)
+        
+        assert results.shape == ()
+        assert results['mu'] == pytest.approx(expected['mu'], rel=1e-12)
+        assert results['tau'] == pytest.approx(expected['tau'], rel=1e-12)
+    
+    def test_scenarios_batch_unknown(self, calculator):
+        """Test that an unknown scenario is rejected."""
+        with pytest.raises(ValueError):
+            calculator.simulate_scenarios_batch('white_hole', {})
+    
     def test_numerical_stability(self, calculator):
         """Test numerical stability with extreme values."""
         # Very small values
@@ -248,37 +387,105 @@ class TestPhysicsScenarios:
     
     def test_time_dilation_increases_with_altitude(self):
         """Test that time runs faster at higher altitudes."""
-        altitudes = [0, 100e3, 400e3, 20000e3]
-        tau_values = []
+        altitudes = np.array([0.0, 100e3, 400e3, 20000e3])
         
-        for h in altitudes:
-            phi_surface = -G * M_earth / R_earth
-            phi_alt = -G * M_earth / (R_earth + h)
-            delta_phi = phi_alt - phi_surface
-            
-            tau = 1 + delta_phi / (c**2)
-            tau_values.append(tau)
+        phi_alt = -G * M_earth / (R_earth + altitudes)
+        tau_values = 1 + (phi_alt - PHI_SURFACE) * INV_C2
         
         # τ should increase with altitude
-        for i in range(len(tau_values) - 1):
-            assert tau_values[i+1] > tau_values[i]
+        assert np.all(np.diff(tau_values) > 0)
+    
+    @pytest.mark.parametrize("backend", ["numba", "numpy"])
+    def test_predict_time_dilation_non_contiguous(self, backend, monkeypatch):
+        """Test that array predictions keep their layout for transposed input."""
+        import simple_earth_sim
+        from simple_earth_sim import predict_time_dilation
+        
+        if backend == "numba":
+            if not simple_earth_sim.HAVE_NUMBA:
+                pytest.skip("numba not installed")
+            monkeypatch.setattr(simple_earth_sim, "NUMBA_MIN_SIZE", 0)
+        else:
+            monkeypatch.setattr(simple_earth_sim, "HAVE_NUMBA", False)
+        
+        altitudes = np.linspace(0.0, 20200e3, 12).reshape(3, 4).T
+        result = predict_time_dilation(altitudes)
+        
+        assert result['tau'].shape == (4, 3)
+        for index in np.ndindex(altitudes.shape):
+            expected = predict_time_dilation(float(altitudes[index]))
+            assert result['tau'][index] == pytest.approx(expected['tau'], rel=1e-14)
+            assert result['mu'][index] == pytest.approx(expected['mu'], rel=1e-14)
     
     def test_singularity_limit(self):
         """Test behavior as r → 0 in black hole."""
-        M = 10 * 1.989e30
-        r_s = 2 * G * M / (c**2)
+        r_s = R_S_10MSUN
         
         # As r → 0, μ → 0, τ → ∞
-        r_values = [r_s/10, r_s/100, r_s/1000, r_s/10000]
+        r_values = r_s / np.array([10, 100, 1000, 10000])
         
-        for r in r_values:
-            mu = r / (2 * r_s)
-            tau = 2 * r_s / r
-            
-            # μ should decrease
-            assert mu < 0.5
-            # τ should increase
-            assert tau > 2
+        mu = r_values / (2 * r_s)
+        tau = 2 * r_s / r_values
+        
+        # μ should decrease
+        assert np.all(mu < 0.5)
+        # τ should increase
+        assert np.all(tau > 2)
+
+
+class TestBlackHole3DFields:
+    """Test the 3D black hole field backends against the NumPy kernel."""
+    
+    @pytest.mark.parametrize("mass_suns", [10, 1e9])
+    @pytest.mark.parametrize("dtype, rtol", [(np.float32, 1e-5), (np.float64, 1e-12)])
+    @pytest.mark.parametrize("backend", ["numpy", "numexpr", "numba", "cupy"])
+    def test_backend_parity(self, backend, dtype, rtol, mass_suns):
+        """Test every backend's μ, ρ, χ, τ against the float64 NumPy kernel."""
+        if backend != "numpy":
+            pytest.importorskip(backend)
+        from black_hole_3d_simulation import BlackHole3DSimulation, M_sun
+        if backend not in BlackHole3DSimulation.available_backends():
+            pytest.skip(f"{backend} backend unavailable")
+        
+        sim = BlackHole3DSimulation(mass=mass_suns * M_sun, backend=backend)
+        # Odd size, so the grid includes the clamped center point
+        X, Y, Z, _ = sim.create_3d_grid(grid_size=17, dtype=dtype)
+        fields = sim._fields(X, Y, Z)
+        reference = sim._fields_numpy(*(a.astype(np.float64) for a in (X, Y, Z)))
+        
+        for field, expected in zip(fields, reference):
+            assert field.shape == (17, 17, 17)
+            assert field.dtype == dtype
+            np.testing.assert_allclose(field, expected, rtol=rtol)
+    
+    @pytest.mark.parametrize("materialize", [False, True])
+    def test_blocked_matches_numpy(self, materialize, monkeypatch):
+        """Test the slabbed kernel when the slab rows do not divide the grid."""
+        from black_hole_3d_simulation import BlackHole3DSimulation
+        
+        sim = BlackHole3DSimulation(backend='numpy')
+        X, Y, Z, _ = sim.create_3d_grid(grid_size=17, dtype=np.float64)
+        if materialize:
+            X, Y, Z = (np.broadcast_to(a, (17, 17, 17)).copy() for a in (X, Y, Z))
+        # Three 17×17 float64 rows of the four fields per slab: 17 = 5·3 + 2
+        monkeypatch.setattr(sim, "_TILE_BYTES", 3 * 4 * 17 * 17 * 8)
+        
+        blocked = sim._fields_blocked(X, Y, Z, (17, 17, 17))
+        for field, expected in zip(blocked, sim._fields_numpy(X, Y, Z)):
+            assert np.array_equal(field, expected)
+    
+    def test_numexpr_large_mass_float32(self):
+        """Test that numexpr keeps ρ finite on a float32 grid around a huge hole."""
+        pytest.importorskip("numexpr")
+        from black_hole_3d_simulation import BlackHole3DSimulation, M_sun
+        
+        sim = BlackHole3DSimulation(mass=1e9 * M_sun, backend='numexpr')
+        X, Y, *fields = sim.simulate_cross_section()
+        reference = sim._fields_numpy(X, Y, np.zeros_like(X))
+        
+        assert np.all(fields[1] > 0)
+        for field, expected in zip(fields, reference):
+            np.testing.assert_allclose(field, expected, rtol=1e-6)
 
 
 def test_imports():
@@ -0,0 +1,36 @@
+"""
+Compiled kernels behind UniversalChangeCalculator's array methods.
+
+numba is optional and costs about a second to import, so it is only
+imported (and the kernels compiled or loaded from its disk cache) when
+an array is large enough to need them. Scalar methods stay plain Python.
+"""
+
+from importlib.util import find_spec
+
+import numpy as np
+
+HAVE_NUMBA = find_spec('numba') is not None
+
+_mu_gravitational_array = None
+
+
+def get_mu_gravitational_array():
+    """Return the parallel μ = ρ/χ kernel, importing numba on first use."""
+    global _mu_gravitational_array
+    if _mu_gravitational_array is None:
+        from numba import njit, prange
+
+        @njit(parallel=True, cache=True)
+        def kernel(rho, chi, tol, out):
+            """
+            Elementwise ρ/χ over flat arrays, rows split across threads.
+            
+            Divides only where |χ| >= tol and gives ∞ elsewhere, including
+            NaN χ, matching np.divide(..., where=np.abs(chi) >= tol).
+            """
+            for i in prange(rho.shape[0]):
+                out[i] = rho[i] / chi[i] if abs(chi[i]) >= tol else np.inf
+
+        _mu_gravitational_array = kernel
+    return _mu_gravitational_array
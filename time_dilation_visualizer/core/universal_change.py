@@ -5,9 +5,24 @@ Implements: μ = ∂ν/∂ε = ΔΨ/Δζ = (ΔS/t)/χ = ρ/χ = 1/τ
 
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from enum import IntEnum
 import warnings
 
+from ._kernels import HAVE_NUMBA, get_mu_gravitational_array
+
+# Record layout returned by the batched scenario sweeps
+MU_TAU_DTYPE = np.dtype([('mu', np.float64), ('tau', np.float64)])
+
+
+class ParameterError(IntEnum):
+    """Bit flags set by validate_parameters_batch, one per validate_parameters check."""
+    EPS_NEG = 1  # Epsilon (perturbation) should be positive
+    CHI_NONPOS = 2  # Chi (resistance to change) must be positive
+    T_NONPOS = 4  # Time must be positive
+    RHO_NEG = 8  # Energy density (rho) should be non-negative
+    MU_TAU_MISMATCH = 16  # Mu and tau are inconsistent (τ ≠ 1/μ)
+
 
 @dataclass
 class PhysicsParameters:
@@ -33,11 +48,68 @@ class PhysicsParameters:
     tau: Optional[float] = None  # Time dilation factor
 
 
+@dataclass(eq=False)
+class PhysicsParameterBatch:
+    """
+    Structure-of-arrays counterpart of PhysicsParameters for ensembles.
+    
+    Each field holds one float64 array across all samples (or None when
+    unused); fields broadcast against each other, so a scalar can stand in
+    for a constant column.
+    """
+    nu: Optional[np.ndarray] = None
+    epsilon: Optional[np.ndarray] = None
+    psi: Optional[np.ndarray] = None
+    zeta: Optional[np.ndarray] = None
+    delta_s: Optional[np.ndarray] = None
+    t: Optional[np.ndarray] = None
+    chi: Optional[np.ndarray] = None
+    rho: Optional[np.ndarray] = None
+    mu: Optional[np.ndarray] = None
+    tau: Optional[np.ndarray] = None
+    
+    def __post_init__(self):
+        for name, value in self.as_dict().items():
+            setattr(self, name, np.asarray(value, dtype=float))
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Broadcast shape of the fields that are set."""
+        return np.broadcast_shapes(*(v.shape for v in self.as_dict().values()))
+    
+    def __len__(self) -> int:
+        # No fields set means no samples, not one 0-d sample
+        return int(np.prod(self.shape)) if self.as_dict() else 0
+    
+    def __eq__(self, other):
+        if not isinstance(other, PhysicsParameterBatch):
+            return NotImplemented
+        mine, theirs = self.as_dict(), other.as_dict()
+        return mine.keys() == theirs.keys() and all(
+            np.array_equal(value, theirs[name]) for name, value in mine.items())
+    
+    def as_dict(self) -> Dict[str, np.ndarray]:
+        """Fields that are set, keyed by name."""
+        return {f.name: getattr(self, f.name) for f in fields(self)
+                if getattr(self, f.name) is not None}
+    
+    def to_params(self, i: int) -> PhysicsParameters:
+        """Sample i (flat index) as a single PhysicsParameters."""
+        shape = self.shape
+        index = np.unravel_index(i, shape) if shape else ()
+        return PhysicsParameters(**{name: float(np.broadcast_to(value, shape)[index])
+                                    for name, value in self.as_dict().items()})
+
+
 class UniversalChangeCalculator:
     """
     Core calculator implementing the universal change equation across all physics domains.
     """
     
+    # Array size above which the parallel numba kernel beats np.divide by
+    # enough to pay for importing numba
+    _NUMBA_MIN_SIZE = 10_000_000
+    
     def __init__(self):
         self.tolerance = 1e-10  # For handling near-zero values
         
@@ -119,6 +191,42 @@ class UniversalChangeCalculator:
             
         return rho / chi
     
+    def calculate_mu_gravitational_array(self, rho: np.ndarray, chi: np.ndarray) -> np.ndarray:
+        """
+        Calculate μ = ρ/χ elementwise for parameter sweeps.
+        
+        Args:
+            rho: Energy densities (array-like)
+            chi: Resistances to change, broadcastable against rho
+            
+        Returns:
+            Array of μ, ∞ where |χ| is below tolerance (one warning per call)
+        """
+        chi = np.asarray(chi, dtype=float)
+        if (np.abs(chi) < self.tolerance).any():
+            warnings.warn("Chi approaching zero - gravitational singularity")
+        
+        return np.asarray(self._mu_gravitational_fast(rho, chi))
+    
+    def _mu_gravitational_fast(self, rho, chi):
+        """
+        μ = ρ/χ without the singularity warning, for scalars or arrays.
+        
+        Same limits as calculate_mu_gravitational (∞ where |χ| < tolerance,
+        and for NaN χ on every backend); callers that need the warning
+        check χ themselves.
+        """
+        if np.ndim(rho) == 0 and np.ndim(chi) == 0:
+            return rho / chi if abs(chi) >= self.tolerance else float('inf')
+        
+        rho, chi = np.broadcast_arrays(np.asarray(rho, dtype=float), np.asarray(chi, dtype=float))
+        mu = np.full(rho.shape, np.inf)
+        if HAVE_NUMBA and mu.size >= self._NUMBA_MIN_SIZE:
+            get_mu_gravitational_array()(rho.ravel(), chi.ravel(), self.tolerance, mu.ravel())
+            return mu
+        
+        return np.divide(rho, chi, out=mu, where=np.abs(chi) >= self.tolerance)
+    
     def calculate_tau_from_mu(self, mu: float) -> float:
         """
         Calculate τ = 1/μ (time dilation from change flow rate).
@@ -199,6 +307,72 @@ class UniversalChangeCalculator:
             
         return results
     
+    def simulate_scenarios_batch(self, scenario: str,
+                                 param_arrays: Union[Dict, PhysicsParameterBatch]) -> np.ndarray:
+        """
+        Simulate a scenario over arrays of parameters in one vectorized pass.
+        
+        Args:
+            scenario: One of 'black_hole', 'light_speed', 'quantum_vacuum', 'universe_expansion'
+            param_arrays: Same keys and defaults as simulate_scenario, with array
+                values that broadcast against each other, or a PhysicsParameterBatch
+                ('quantum_vacuum' takes its psi/zeta ranges from a dict only)
+            
+        Returns:
+            Structured array with fields 'mu' and 'tau', one record per sample
+        """
+        if isinstance(param_arrays, PhysicsParameterBatch):
+            param_arrays = param_arrays.as_dict()
+        tol = self.tolerance
+        
+        def arr(key, default):
+            return np.asarray(param_arrays.get(key, default), dtype=float)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if scenario == 'black_hole':
+                mu = self.calculate_mu_gravitational_array(arr('rho', 1e3), arr('chi', 1e6))
+                
+            elif scenario == 'light_speed':
+                epsilon, nu = np.broadcast_arrays(arr('epsilon', 1e-10), arr('nu', 1.0))
+                near_zero = np.abs(epsilon) < tol
+                if near_zero.any():
+                    warnings.warn("Epsilon approaching zero - quantum uncertainty limit")
+                mu = np.where(near_zero, np.where(nu > 0, np.inf, 0.0), nu / epsilon)
+                
+            elif scenario == 'quantum_vacuum':
+                psi1, psi2 = param_arrays.get('psi_range', (0.0, 1.0))
+                zeta1, zeta2 = param_arrays.get('zeta_range', (0.0, 0.1))
+                delta_psi, delta_zeta = np.broadcast_arrays(
+                    np.subtract(psi2, psi1, dtype=float), np.subtract(zeta2, zeta1, dtype=float))
+                near_zero = np.abs(delta_zeta) < tol
+                if near_zero.any():
+                    warnings.warn("Delta zeta approaching zero - state change singularity")
+                mu = np.where(near_zero, np.where(delta_psi > 0, np.inf, 0.0), delta_psi / delta_zeta)
+                
+            elif scenario == 'universe_expansion':
+                delta_s, t, chi = np.broadcast_arrays(arr('delta_s', 1e23), arr('t', 1e17), arr('chi', 1e6))
+                chi_zero = np.abs(chi) < tol
+                t_zero = ~chi_zero & (np.abs(t) < tol)
+                if chi_zero.any():
+                    warnings.warn("Chi approaching zero - no resistance to change")
+                if t_zero.any():
+                    warnings.warn("Time approaching zero - instantaneous change")
+                mu = np.where(chi_zero, np.inf,
+                              np.where(t_zero, np.where(delta_s != 0, np.inf, 0.0), (delta_s / t) / chi))
+                
+            else:
+                raise ValueError(f"Unknown scenario: {scenario}")
+            
+            mu_zero = np.abs(mu) < tol
+            if mu_zero.any():
+                warnings.warn("Mu approaching zero - time dilation approaching infinity")
+            tau = np.where(mu_zero, np.inf, 1.0 / mu)
+        
+        results = np.empty(mu.shape, dtype=MU_TAU_DTYPE)
+        results['mu'] = mu
+        results['tau'] = tau
+        return results
+    
     def validate_parameters(self, params: PhysicsParameters) -> Tuple[bool, List[str]]:
         """
         Validate physics parameters for consistency and physical meaning.
@@ -230,4 +404,43 @@ class UniversalChangeCalculator:
             if abs(params.tau - expected_tau) > self.tolerance:
                 errors.append("Mu and tau are inconsistent (τ ≠ 1/μ)")
         
-        return len(errors) == 0, errors
\ No newline at end of file
+        return len(errors) == 0, errors
+    
+    def validate_parameters_batch(self, arrays: Union[Dict, PhysicsParameterBatch]
+                                  ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate arrays of physics parameters in one vectorized pass.
+        
+        Args:
+            arrays: PhysicsParameterBatch, or a mapping of its field names
+                ('epsilon', 'chi', 't', 'rho', 'mu', 'tau') to broadcastable
+                arrays; missing keys are skipped, like None fields in
+                validate_parameters
+            
+        Returns:
+            Tuple of (is_valid mask, int8 array of OR-ed ParameterError flags)
+        """
+        if isinstance(arrays, PhysicsParameterBatch):
+            arrays = arrays.as_dict()
+        values = {key: np.asarray(arrays[key], dtype=float)
+                  for key in ('epsilon', 'chi', 't', 'rho', 'mu', 'tau') if key in arrays}
+        codes = np.zeros(np.broadcast_shapes(*(v.shape for v in values.values())), dtype=np.int8)
+        
+        checks = [
+            ('epsilon', np.less, ParameterError.EPS_NEG),
+            ('chi', np.less_equal, ParameterError.CHI_NONPOS),
+            ('t', np.less_equal, ParameterError.T_NONPOS),
+            ('rho', np.less, ParameterError.RHO_NEG),
+        ]
+        for key, compare, flag in checks:
+            if key in values:
+                codes |= np.where(compare(values[key], 0), np.int8(flag), np.int8(0))
+        
+        if 'mu' in values and 'tau' in values:
+            mu = values['mu']
+            expected_tau = np.divide(1.0, mu, out=np.full(mu.shape, np.inf), where=mu != 0)
+            with np.errstate(invalid='ignore'):
+                mismatch = np.abs(values['tau'] - expected_tau) > self.tolerance
+            codes |= np.where(mismatch, np.int8(ParameterError.MU_TAU_MISMATCH), np.int8(0))
+        
+        return codes == 0, codes
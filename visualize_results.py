@@ -12,15 +12,26 @@ M_earth = 5.972e24
 R_earth = 6.371e6
 c = 299792458
 
+# Altitude-independent quantities, computed once at module load
+GM_EARTH = G * M_earth
+PHI_SURFACE = -GM_EARTH / R_earth
+INV_C2 = 1.0 / (c * c)
+
+# Row template for the summary table, parsed once
+SUMMARY_ROW = "{:<10} {:<18.12f} {:<18.12f} {:<15.3f}".format
+
 def calculate_time_dilation(altitude):
-    """Calculate time dilation using universal change equation."""
-    r = R_earth + altitude
-    phi_surface = -G * M_earth / R_earth
-    phi_altitude = -G * M_earth / r
-    delta_phi = phi_altitude - phi_surface
+    """
+    Calculate time dilation using universal change equation.
+    
+    Args:
+        altitude: Height above the surface (m), scalar or array; every
+            result entry then has the same shape
+    """
+    delta_phi = -GM_EARTH / (R_earth + altitude) - PHI_SURFACE
     
     # Einstein's prediction: τ ≈ 1 + Δφ/c²
-    tau_einstein = 1 + delta_phi / (c**2)
+    tau_einstein = 1 + delta_phi * INV_C2
     
     # Universal change: μ = 1/τ, with ρ = μ, χ = 1
     mu = 1.0 / tau_einstein
@@ -37,16 +48,22 @@ def create_visualization():
     altitudes_km = np.logspace(0, 4, 1000)  # 1 km to 10,000 km
     altitudes_m = altitudes_km * 1000
     
-    # Calculate results
-    mu_values = []
-    tau_values = []
-    time_gains = []
+    # Calculate results for every altitude at once
+    results = calculate_time_dilation(altitudes_m)
+    mu_values = results['mu']
+    tau_values = results['tau']
+    time_gains = results['time_gain_ns_per_s']
     
-    for alt in altitudes_m:
-        result = calculate_time_dilation(alt)
-        mu_values.append(result['mu'])
-        tau_values.append(result['tau'])
-        time_gains.append(result['time_gain_ns_per_s'])
+    # Key altitudes on the plotted range, each at its nearest sample
+    # (binary search on the sorted altitudes, then the closer neighbor)
+    key_altitudes = {'ISS': 408, 'GPS': 20200}
+    key_altitudes = {name: alt_km for name, alt_km in key_altitudes.items()
+                     if alt_km <= altitudes_km.max()}
+    key_km = np.array(list(key_altitudes.values()), dtype=float)
+    after = np.searchsorted(altitudes_km, key_km).clip(0, len(altitudes_km) - 1)
+    before = (after - 1).clip(0)
+    key_idx = np.where(np.abs(altitudes_km[before] - key_km) <= np.abs(altitudes_km[after] - key_km),
+                       before, after)
     
     # Create the plots
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
@@ -60,16 +77,13 @@ def create_visualization():
     ax1.axhline(y=1.0, color='r', linestyle='--', alpha=0.7, label='μ = 1 (normal spacetime)')
     
     # Add key altitude markers
-    key_altitudes = {'ISS': 408, 'GPS': 20200}
-    for name, alt_km in key_altitudes.items():
-        if alt_km <= max(altitudes_km):
-            idx = np.argmin(np.abs(altitudes_km - alt_km))
-            ax1.plot(alt_km, mu_values[idx], 'ro', markersize=8)
-            ax1.annotate(f'{name}\nμ = {mu_values[idx]:.12f}', 
-                        xy=(alt_km, mu_values[idx]),
-                        xytext=(20, 20), textcoords='offset points',
-                        bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
-                        fontsize=9)
+    for (name, alt_km), idx in zip(key_altitudes.items(), key_idx):
+        ax1.plot(alt_km, mu_values[idx], 'ro', markersize=8)
+        ax1.annotate(f'{name}\nμ = {mu_values[idx]:.12f}', 
+                    xy=(alt_km, mu_values[idx]),
+                    xytext=(20, 20), textcoords='offset points',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
+                    fontsize=9)
     ax1.legend()
     
     # Plot 2: Time Dilation Factor τ vs Altitude
@@ -81,15 +95,13 @@ def create_visualization():
     ax2.axhline(y=1.0, color='r', linestyle='--', alpha=0.7, label='τ = 1 (no dilation)')
     
     # Add key altitude markers
-    for name, alt_km in key_altitudes.items():
-        if alt_km <= max(altitudes_km):
-            idx = np.argmin(np.abs(altitudes_km - alt_km))
-            ax2.plot(alt_km, tau_values[idx], 'ro', markersize=8)
-            ax2.annotate(f'{name}\nτ = {tau_values[idx]:.12f}', 
-                        xy=(alt_km, tau_values[idx]),
-                        xytext=(20, 20), textcoords='offset points',
-                        bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
-                        fontsize=9)
+    for (name, alt_km), idx in zip(key_altitudes.items(), key_idx):
+        ax2.plot(alt_km, tau_values[idx], 'ro', markersize=8)
+        ax2.annotate(f'{name}\nτ = {tau_values[idx]:.12f}', 
+                    xy=(alt_km, tau_values[idx]),
+                    xytext=(20, 20), textcoords='offset points',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
+                    fontsize=9)
     ax2.legend()
     
     # Plot 3: Time Gain (ns/s) vs Altitude
@@ -100,15 +112,13 @@ def create_visualization():
     ax3.grid(True, alpha=0.3)
     
     # Add key altitude markers
-    for name, alt_km in key_altitudes.items():
-        if alt_km <= max(altitudes_km):
-            idx = np.argmin(np.abs(altitudes_km - alt_km))
-            ax3.plot(alt_km, abs(time_gains[idx]), 'ro', markersize=8)
-            ax3.annotate(f'{name}\n{time_gains[idx]:.3f} ns/s', 
-                        xy=(alt_km, abs(time_gains[idx])),
-                        xytext=(20, 20), textcoords='offset points',
-                        bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
-                        fontsize=9)
+    for (name, alt_km), idx in zip(key_altitudes.items(), key_idx):
+        ax3.plot(alt_km, abs(time_gains[idx]), 'ro', markersize=8)
+        ax3.annotate(f'{name}\n{time_gains[idx]:.3f} ns/s', 
+                    xy=(alt_km, abs(time_gains[idx])),
+                    xytext=(20, 20), textcoords='offset points',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
+                    fontsize=9)
     
     # Plot 4: μ vs τ relationship
     ax4.plot(mu_values, tau_values, 'orange', linewidth=2, label='μ vs τ')
@@ -119,7 +129,7 @@ def create_visualization():
     ax4.grid(True, alpha=0.3)
     
     # Add theoretical line τ = 1/μ
-    mu_theory = np.linspace(min(mu_values), max(mu_values), 100)
+    mu_theory = np.linspace(mu_values.min(), mu_values.max(), 100)
     tau_theory = 1.0 / mu_theory
     ax4.plot(mu_theory, tau_theory, 'r--', alpha=0.7, label='τ = 1/μ (theory)')
     ax4.legend()
@@ -149,7 +159,7 @@ def print_summary():
     print("-" * 65)
     
     for name, result in key_results.items():
-        print(f"{name:<10} {result['mu']:<18.12f} {result['tau']:<18.12f} {result['time_gain_ns_per_s']:<15.3f}")
+        print(SUMMARY_ROW(name, result['mu'], result['tau'], result['time_gain_ns_per_s']))
     
     print(f"\n🔬 Physical Interpretation:")
     print(f"• μ = ρ/χ represents the 'change flow rate' in spacetime")